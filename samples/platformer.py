@@ -11,7 +11,6 @@ from tilengine import Engine, Window, Tilemap, Input, Color, SequencePack
 frame = 0
 basepos = 0
 speed = 0
-pos_background = [0, 0, 0, 0, 0, 0]
 background_colors = [Color(28, 0, 140),
 			 		 Color(0, 128, 238)]
 
@@ -25,33 +24,34 @@ def lerp(x, x0, x1, fx0, fx1):
 def setup_layer(layer, name):
 	tilemap = Tilemap.fromfile(name)
 	layer.setup(tilemap)
-	engine.set_background_color(tilemap)
 
 
-# raster effect callback
-def raster_effect(line):
-	pos = -1
+# integrates user input into scroll speed and advances base position
+def update_scroll(speed, basepos, right, left):
+	if right:
+		speed = min(speed + 0.04, 1.0)
+	elif speed > 0:
+		speed = max(speed - 0.02, 0.0)
 
-	if line == 0:
-		pos = pos_background[0]
-	elif line == 32:
-		pos = pos_background[1]
-	elif line == 48:
-		pos = pos_background[2]
-	elif line == 64:
-		pos = pos_background[3]
-	elif line == 112:
-		pos = pos_background[4]
-	elif line >= 152:
-		pos = lerp(line, 152, 224, pos_background[4], pos_background[5])
-
-	if pos != -1:
-		background.set_position(pos, 0)
+	if left:
+		speed = max(speed - 0.04, -1.0)
+	elif speed < 0:
+		speed = min(speed + 0.02, 0.0)
+
+	return speed, basepos + speed
 
-	if line == 0:
-		engine.set_background_color(background_colors[0])
-	elif line == 144:
-		engine.set_background_color(background_colors[1])
+
+# per-scanline scroll factors relative to basepos, None leaves the layer untouched
+def build_scroll_factors(height):
+	factors = [None] * height
+	factors[0] = 0.562
+	factors[32] = 0.437
+	factors[48] = 0.375
+	factors[64] = 0.625
+	factors[112] = 1.000
+	for line in range(152, height):
+		factors[line] = lerp(line, 152, 224, 1.000, 2.000)
+	return factors
 
 
 # initialise 400x240 resolution, 2 background layers, no sprites and 20 animation slots
@@ -63,6 +63,7 @@ background = engine.layers[1]
 engine.set_load_path("assets/sonic")
 setup_layer(foreground, "Sonic_md_fg1.tmx")
 setup_layer(background, "Sonic_md_bg1.tmx")
+engine.set_background_color(background.tilemap)
 
 # color cycle animation for water
 sequence_pack = SequencePack.fromfile("Sonic_md_seq.sqx")
@@ -70,6 +71,22 @@ palette = background.tilemap.tileset.palette
 animation = engine.get_available_animation()
 engine.animations[animation].set_palette_animation(palette, sequence_pack.sequences["seq_water"], True);
 
+# raster effect callback, called once per scanline: objects used inside are
+# bound as default arguments so they are resolved once instead of per call
+scroll_factors = build_scroll_factors(240)
+
+def raster_effect(line, factors=scroll_factors, colors=background_colors,
+		set_position=background.set_position, set_background_color=engine.set_background_color):
+	factor = factors[line]
+	if factor is not None:
+		set_position(basepos * factor, 0)
+
+	if line == 0:
+		set_background_color(colors[0])
+	elif line == 144:
+		set_background_color(colors[1])
+
+
 # setup raster callback
 engine.set_raster_callback(raster_effect)
 
@@ -77,25 +94,7 @@ engine.set_raster_callback(raster_effect)
 window = Window.create()
 while window.process():
 
-	# process user input
-	if window.get_input(Input.RIGHT):
-		speed = min(speed + 0.04, 1.0)
-	elif speed > 0:
-		speed = max(speed - 0.02, 0.0)
-
-	if window.get_input(Input.LEFT):
-		speed = max(speed - 0.04, -1.0)
-	elif speed < 0:
-		speed = min(speed + 0.02, 0.0)
-
-	# scroll
-	basepos += speed
+	# process user input and scroll
+	speed, basepos = update_scroll(speed, basepos, window.get_input(Input.RIGHT), window.get_input(Input.LEFT))
 	pos_foreground = basepos * 3
 	foreground.set_position(pos_foreground, 0)
-
-	pos_background[0] = basepos * 0.562
-	pos_background[1] = basepos * 0.437
-	pos_background[2] = basepos * 0.375
-	pos_background[3] = basepos * 0.625
-	pos_background[4] = basepos * 1.000
-	pos_background[5] = basepos * 2.000
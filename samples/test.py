@@ -9,4 +9,4 @@ engine.layers[0].setup(foreground)
 
 window = Window.create()
 while window.process():
-	window.draw_frame()
+	pass
@@ -30,10 +30,17 @@ SOFTWARE.
 # pylint: disable=W0614
 # pylint: disable=W0312
 # pylint: disable=R0201
-from sys import platform as _platform
+from sys import platform as _platform, intern as _intern
 from ctypes import *
-from os import path
+from ctypes import _Pointer, _SimpleCData
+from os import path, fspath
+from re import findall as _findall
+from threading import local as _thread_local
+from weakref import finalize as _finalize
+from functools import cached_property, lru_cache
+from collections.abc import Mapping
 from typing import List, Union, Optional
+from types import FunctionType, MethodType, BuiltinFunctionType, BuiltinMethodType
 
 
 # constants --------------------------------------------------------------------
@@ -155,6 +162,14 @@ class Tile(Structure):
 	]
 
 
+# empty tile passed to erase tilemap cells, read-only so the shared instance can't be modified by mistake
+class _ReadOnlyTile(Tile):
+	def __setattr__(self, name, value):
+		raise AttributeError("shared empty tile is read-only")
+
+_ZERO_TILE = _ReadOnlyTile()
+
+
 class ColorStrip(Structure):
 	"""
 	Data used to define each frame of a color cycle for :class:`Sequence` objects
@@ -317,6 +332,8 @@ class Color(object):
 	"""
 	Represents a color value in RGB format
 	"""
+	__slots__ = ('r', 'g', 'b')
+
 	def __init__(self, r: int, g: int, b: int):
 		self.r = r
 		self.g = g
@@ -325,14 +342,15 @@ class Color(object):
 	@classmethod
 	def fromstring(cls, string: str):
 		""" creates a color from a ccs-style #rrggbb string """
-		r = int(string[1:3], 16)
-		g = int(string[3:5], 16)
-		b = int(string[5:7], 16)
-		return Color(r, g, b)
+		value = int(string[1:7], 16)
+		return cls((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+
+	def _set_background_color(self):
+		_TLN_SetBGColor(self.r, self.g, self.b)
 
 
 # module internal variables
-_tln: "Engine"			# handle to shared native library
+_tln: "_NativeLibrary"	# handle to shared native library
 _window: "Window"		# singleton window
 _window_created = False	# singleton window is created
 
@@ -347,21 +365,64 @@ elif _platform == "darwin":
 else:
 	raise OSError("Unsupported platform: must be Windows, Linux or Mac OS")
 
+# ctypes signatures of native functions, as (argtypes, restype) or (argtypes, restype, errcheck) indexed by name
+_signatures = dict()
+
+
+class _NativeLibrary(object):
+	"""
+	Wrapper of the loaded shared library that resolves each native function on first use,
+	assigning its ctypes signature from _signatures, instead of resolving all of them at import time
+	"""
+	def __init__(self, library: CDLL):
+		self._library = library
+
+	def __getattr__(self, name: str):
+		function = getattr(self._library, name)
+		signature = _signatures.get(name)
+		if signature is not None:
+			function.argtypes, function.restype = signature[:2]
+			if len(signature) > 2:
+				function.errcheck = signature[2]
+		setattr(self, name, function)
+		return function
+
+
 # load native library. Try local path, if not, system path
 if path.isfile(_library):
-	_tln = cdll.LoadLibrary(f"./{_library}")
+	_tln = _NativeLibrary(cdll.LoadLibrary(f"./{_library}"))
 else:
-	_tln = cdll.LoadLibrary(_library)
+	_tln = _NativeLibrary(cdll.LoadLibrary(_library))
+
+# plain Python callables, that are never taken for compiled code
+_python_callables = (FunctionType, MethodType, BuiltinFunctionType, BuiltinMethodType)
 
 # callback types for user functions
 _video_callback_function = CFUNCTYPE(None, c_int)
 _blend_function = CFUNCTYPE(c_ubyte, c_ubyte, c_ubyte)
 
 
-# convert string to c_char_p
+# wraps user function in a callback type. Already compiled functions exposing their native
+# address (like numba @cfunc) are bound directly, so the library calls them without a Python frame.
+# Python functions and methods are always wrapped, even if they carry an unrelated address attribute
+def _make_callback(callback_type, function):
+	address = getattr(function, "address", None)
+	if not isinstance(address, int) or isinstance(function, _python_callables):
+		return callback_type(function)
+	callback = callback_type(address)
+	callback.source = function	# keeps compiled code alive while in use
+	return callback
+
+
+# encoded names and paths are cached, as the same ones are passed over and over (sprite and sequence lookups, reloads)
+@lru_cache(maxsize=512)
+def _encode_cached(string: str) -> bytes:
+	return string.encode()
+
+# convert string (or path-like object) to c_char_p
 def _encode_string(string: Optional[str]):
 	if string is not None:
-		return string.encode()
+		return _encode_cached(fspath(string))
 	return None
 
 # convert c_char_p to string
@@ -370,57 +431,165 @@ def _decode_string(byte_array: Optional[bytearray]):
 		return byte_array.decode()
 	return None
 
+# convert c_char_p holding an object name to an interned string, so name-keyed lookups compare by identity.
+# Names of sequences and sprites are few and long-lived, so keeping them interned is cheap
+def _decode_name(byte_array: Optional[bytearray]):
+	if byte_array is not None:
+		return _intern(byte_array.decode())
+	return None
+
+
+# ctypes arguments that already reference native data, passed through unchanged instead of mapped as buffers
+_CArgObject = type(byref(c_int()))
+
+# returns the numeric kind of a buffer or ctypes format code: signed, unsigned or float
+def _format_kind(fmt):
+	code = fmt.lstrip("@=<>!")
+	if code in ("b", "h", "i", "l", "q", "n"):
+		return "signed"
+	if code in ("B", "H", "I", "L", "Q", "N"):
+		return "unsigned"
+	if code in ("e", "f", "d"):
+		return "float"
+	return code
+
+# tells whether a buffer can be mapped as an array of the given ctypes type. Simple types need items of the same
+# size and kind. Structures accept raw bytes, records with the same members (numpy structured arrays), items
+# matching their fields when all fields share the same type, or whole-structure words when those fields are
+# unsigned (a Tile packed as a 32-bit integer)
+def _buffer_matches(structure_type, view):
+	kind, item_size = _format_kind(view.format), view.itemsize
+	if issubclass(structure_type, _SimpleCData):
+		return item_size == sizeof(structure_type) and kind == _format_kind(structure_type._type_)
+	if item_size == 1 and view.format.lstrip("@=<>!") in ("B", "b", "c"):
+		return True
+	if view.format.startswith("T{"):
+		codes = _findall(r"[@=<>!]?([a-zA-Z?])(?::[^:]*:)?", view.format[2:-1])
+		fields = [field[1] for field in structure_type._fields_]
+		return item_size == sizeof(structure_type) and len(codes) == len(fields) and all(
+			issubclass(field, _SimpleCData) and _format_kind(code) == _format_kind(field._type_)
+			for code, field in zip(codes, fields))
+	field_types = set(field[1] for field in structure_type._fields_)
+	if len(field_types) != 1:
+		return False
+	field_type = field_types.pop()
+	if not issubclass(field_type, _SimpleCData) or kind != _format_kind(field_type._type_):
+		return False
+	return item_size == sizeof(field_type) or (item_size == sizeof(structure_type) and kind == "unsigned")
+
+# returns items as a contiguous ctypes array of the given structure type. Lists and tuples are packed, objects
+# exposing a buffer (array, bytearray, numpy arrays) are mapped without copying when writable, and ctypes arrays,
+# pointers, byref() arguments and None are passed through unchanged. Buffers whose item format or size doesn't
+# match the structure type raise TypeError or ValueError instead of being reinterpreted
+def _as_array(structure_type, items):
+	if items is None or isinstance(items, (Array, _Pointer, _SimpleCData, _CArgObject)):
+		return items
+	if isinstance(items, (list, tuple)):
+		return (structure_type * len(items))(*items)
+	try:
+		view = memoryview(items)
+	except TypeError:
+		return items
+	if not _buffer_matches(structure_type, view):
+		raise TypeError("buffer of format '%s' doesn't match %s" % (view.format, structure_type.__name__))
+	item_size = sizeof(structure_type)
+	if view.nbytes % item_size != 0:
+		raise ValueError("buffer size %d isn't a multiple of %s size %d" % (view.nbytes, structure_type.__name__, item_size))
+	array_type = structure_type * (view.nbytes // item_size)
+	if view.readonly:
+		return array_type.from_buffer_copy(view)
+	return array_type.from_buffer(view)
+
+
+# returns a non-owning wrapper of the same native object, reusing the attributes already fetched by the source.
+# The view keeps the source alive, so the shared data isn't released while the view is in use
+def _make_view(resource):
+	view = type(resource)(resource._as_parameter_, False)
+	for name, value in resource.__dict__.items():
+		view.__dict__.setdefault(name, value)
+	view._source = resource
+	return view
+
+
+# per-thread structures reused by queries when the caller doesn't provide its own
+_scratch = _thread_local()
+
+def _get_scratch(structure_type):
+	structure = getattr(_scratch, structure_type.__name__, None)
+	if structure is None:
+		structure = structure_type()
+		setattr(_scratch, structure_type.__name__, structure)
+	return structure
+
 
 # error handling --------------------------------------------------------------
-_tln.TLN_GetLastError.restype = c_int
-_tln.TLN_GetErrorString.argtypes = [c_int]
-_tln.TLN_GetErrorString.restype = c_char_p
+_signatures.update({
+	"TLN_GetLastError": (None, c_int),
+	"TLN_GetErrorString": ([c_int], c_char_p),
+})
+
+
+# error descriptions indexed by error code, filled on first use
+_error_strings = dict()
 
 
 # raises exception depending on error code
 def _raise_exception(result: bool=False):
 	if result is not True:
 		error = _tln.TLN_GetLastError()
-		error_string = _tln.TLN_GetErrorString(error)
-		raise TilengineException(error_string.decode())
+		error_string = _error_strings.get(error)
+		if error_string is None:
+			error_string = _tln.TLN_GetErrorString(error).decode()
+			_error_strings[error] = error_string
+		raise TilengineException(error_string)
+
+
+# errcheck for functions returning a new object handle, raises instead of returning a null handle
+def _check_handle(result, function, arguments):
+	if result is None:
+		_raise_exception()
+	return result
+
+# errcheck for functions returning a success flag, raises on failure so wrappers don't check each result
+def _check_bool(result, function, arguments):
+	if not result:
+		_raise_exception()
+	return result
 
 # World management
-_tln.TLN_LoadWorld.argtypes = [c_char_p, c_int]
-_tln.TLN_LoadWorld.restype = c_bool
-_tln.TLN_SetWorldPosition.argtypes = [c_int, c_int]
-_tln.TLN_SetWorldPosition.restype = None
-_tln.TLN_SetLayerParallaxFactor.argtypes = [c_int, c_float, c_float]
-_tln.TLN_SetLayerParallaxFactor.restype = c_bool
-_tln.TLN_SetSpriteWorldPosition.argtypes = [c_int, c_int, c_int]
-_tln.TLN_SetSpriteWorldPosition.restype = c_bool
-_tln.TLN_ReleaseWorld.argtypes = None
-_tln.TLN_ReleaseWorld.restype = None
+_signatures.update({
+	"TLN_LoadWorld": ([c_char_p, c_int], c_bool),
+	"TLN_SetWorldPosition": ([c_int, c_int], None),
+	"TLN_SetLayerParallaxFactor": ([c_int, c_float, c_float], c_bool, _check_bool),
+	"TLN_SetSpriteWorldPosition": ([c_int, c_int, c_int], c_bool, _check_bool),
+	"TLN_ReleaseWorld": (None, None),
+})
 
 # basic management ------------------------------------------------------------
-_tln.TLN_Init.argtypes = [c_int, c_int, c_int, c_int, c_int]
-_tln.TLN_Init.restype = c_void_p
-_tln.TLN_DeleteContext.argtypes = [c_void_p]
-_tln.TLN_DeleteContext.restype = c_bool
-_tln.TLN_SetContext.argtypes = [c_void_p]
-_tln.TLN_SetContext.restype = c_bool
-_tln.TLN_GetContext.restype = c_void_p
-_tln.TLN_GetNumObjects.restype = c_int
-_tln.TLN_GetVersion.restype = c_int
-_tln.TLN_GetUsedMemory.restype = c_int
-_tln.TLN_SetBGColor.argtypes = [c_ubyte, c_ubyte, c_ubyte]
-_tln.TLN_SetBGColorFromTilemap.argtypes = [c_void_p]
-_tln.TLN_SetBGColorFromTilemap.restype = c_bool
-_tln.TLN_SetBGBitmap.argtypes = [c_void_p]
-_tln.TLN_SetBGBitmap.restype = c_bool
-_tln.TLN_SetBGPalette.argtypes = [c_void_p]
-_tln.TLN_SetBGPalette.restype = c_bool
-_tln.TLN_SetRenderTarget.argtypes = [c_void_p, c_int]
-_tln.TLN_UpdateFrame.argtypes = [c_int]
-_tln.TLN_SetLoadPath.argtypes = [c_char_p]
-_tln.TLN_SetLogLevel.argtypes = [c_int]
-_tln.TLN_OpenResourcePack.argtypes = [c_char_p, c_char_p]
-_tln.TLN_OpenResourcePack.restype = c_bool
-_tln.TLN_SetSpritesMaskRegion.argtypes = [c_int, c_int]
+_signatures.update({
+	"TLN_Init": ([c_int, c_int, c_int, c_int, c_int], c_void_p),
+	"TLN_DeleteContext": ([c_void_p], c_bool),
+	"TLN_SetContext": ([c_void_p], c_bool),
+	"TLN_GetContext": (None, c_void_p),
+	"TLN_GetNumObjects": (None, c_int),
+	"TLN_GetVersion": (None, c_int),
+	"TLN_GetUsedMemory": (None, c_int),
+	"TLN_SetBGColor": ([c_ubyte, c_ubyte, c_ubyte], None),
+	"TLN_SetBGColorFromTilemap": ([c_void_p], c_bool),
+	"TLN_SetBGBitmap": ([c_void_p], c_bool),
+	"TLN_SetBGPalette": ([c_void_p], c_bool),
+	"TLN_SetRenderTarget": ([c_void_p, c_int], None),
+	"TLN_UpdateFrame": ([c_int], None),
+	"TLN_SetLoadPath": ([c_char_p], None),
+	"TLN_SetLogLevel": ([c_int], None),
+	"TLN_OpenResourcePack": ([c_char_p, c_char_p], c_bool),
+	"TLN_SetSpritesMaskRegion": ([c_int, c_int], None),
+})
+
+# per-frame functions bound once to skip the library attribute lookup on each call. Later sections
+# bind their own per-frame functions the same way, with the same _TLN_ prefix
+_TLN_UpdateFrame = _tln.TLN_UpdateFrame
+_TLN_SetBGColor = _tln.TLN_SetBGColor
 
 class Engine(object):
 	"""
@@ -433,9 +602,11 @@ class Engine(object):
 	"""
 	def __init__(self, handle: c_void_p, num_layers: int, num_sprites: int, num_animations: int):
 		self._as_parameter_ = handle
-		self.layers = tuple([Layer(n) for n in range(num_layers)])
-		self.sprites = tuple([Sprite(n) for n in range(num_sprites)])
-		self.animations = tuple([Animation(n) for n in range(num_animations)])
+		self.layers = tuple(map(Layer, range(num_layers)))
+		for shadow in _sprite_shadows.values():	# sprites of a new engine start unconfigured
+			shadow.reset()
+		self.sprites = tuple(map(Sprite, range(num_sprites)))
+		self.animations = tuple(map(Animation, range(num_animations)))
 		self.version = _tln.TLN_GetVersion()
 		self.cb_raster_func = None
 		self.cb_frame_func = None
@@ -490,13 +661,33 @@ class Engine(object):
 		Sets the background color
 
 		:param param: can be a Color object or a Tilemap object. In this case, \
-			it assigns de background color as defined inside the tilemap
+			it assigns de background color as defined inside the tilemap. Other types raise TypeError
+
+		In raster callbacks, :meth:`Engine.set_background_color_rgb` avoids having to build a Color object
 		"""
-		param_type = type(param)
-		if param_type is Color:
-			_tln.TLN_SetBGColor(param.r, param.g, param.b)
-		elif param_type is Tilemap:
-			_tln.TLN_SetBGColorFromTilemap(param)
+		try:
+			set_background_color = param._set_background_color
+		except AttributeError:
+			raise TypeError("background color must be Color or Tilemap, not %s" % type(param).__name__) from None
+		set_background_color()
+
+	def set_background_color_rgb(self, r: int, g: int, b: int):
+		"""
+		Sets the background color from its components, without building a Color object
+
+		:param r: red component (0-255)
+		:param g: green component (0-255)
+		:param b: blue component (0-255)
+		"""
+		_TLN_SetBGColor(r, g, b)
+
+	def set_background_color_from_tilemap(self, tilemap: "Tilemap"):
+		"""
+		Sets the background color as defined inside the tilemap
+
+		:param tilemap: Tilemap object with the background color to use
+		"""
+		tilemap._set_background_color()
 
 	def disable_background_color(self):
 		"""
@@ -534,15 +725,18 @@ class Engine(object):
 		Example::
 
 			def my_raster_callback(num_scanline):
-			    if num_scanline is 32:
-			        engine.set_background_color(Color(0,0,0))
+			    if num_scanline == 32:
+			        engine.set_background_color_rgb(0, 0, 0)
 
 			engine.set_raster_callback(my_raster_callback)
+
+		The callback can also be a native function exposing its ``address``, like a numba ``@cfunc("void(int32)")``. \
+		It is then called directly by the library, with no Python overhead per scanline
 		"""
 		if raster_callback is None:
 			self.cb_raster_func = None
 		else:
-			self.cb_raster_func = _video_callback_function(raster_callback)
+			self.cb_raster_func = _make_callback(_video_callback_function, raster_callback)
 		_tln.TLN_SetRasterCallback(self.cb_raster_func)
 
 	def set_frame_callback(self, frame_callback):
@@ -558,11 +752,13 @@ class Engine(object):
 		        engine.set_background_color(Color(0,0,0))
 
 			engine.set_frame_callback(my_frame_callback)
+
+		As in :meth:`Engine.set_raster_callback`, a native function exposing its ``address`` is also accepted
 		"""
 		if frame_callback is None:
 			self.cb_frame_func = None
 		else:
-			self.cb_frame_func = _video_callback_function(frame_callback)
+			self.cb_frame_func = _make_callback(_video_callback_function, frame_callback)
 		_tln.TLN_SetFrameCallback(self.cb_frame_func)
 
 	def set_render_target(self, pixels, pitch):
@@ -580,7 +776,7 @@ class Engine(object):
 
 		:param num_frame: optional frame number for animation control
 		"""
-		_tln.TLN_UpdateFrame(num_frame)
+		_TLN_UpdateFrame(num_frame)
 
 	def set_load_path(self, path: str):
 		"""
@@ -606,8 +802,11 @@ class Engine(object):
 			    return (src + dst) / 2
 
 			engine.set_custom_blend_function(blend_50)
+
+		As this function is called for every blended pixel component, a native function exposing its ``address``, \
+		like a numba ``@cfunc("uint8(uint8, uint8)")``, is also accepted and recommended
 		"""
-		self.cb_blend_func = _blend_function(blend_function)
+		self.cb_blend_func = _make_callback(_blend_function, blend_function)
 		_tln.TLN_SetCustomBlendFunction(self.cb_blend_func)
 
 	def set_log_level(self, log_level: int):
@@ -636,7 +835,7 @@ class Engine(object):
 		:param filename: file with the resource package (.dat extension)
 		:param key: optional null-terminated ASCII string with aes decryption key
 		"""
-		ok = _tln.TLN_OpenResourcePack(_encode_string(str(filename)), _encode_string(str(key)))
+		ok = _tln.TLN_OpenResourcePack(_encode_string(filename), _encode_string(key))
 		_raise_exception(ok)
 
 	def close_resource_pack(self):
@@ -652,8 +851,7 @@ class Engine(object):
 		:param top: upper scaline of the exclusion region
 		:param bottom: lower scanline of the exclusion region
 		"""
-		ok = _tln.TLN_SetSpritesMaskRegion(top, bottom)
-		_raise_exception(ok)
+		_tln.TLN_SetSpritesMaskRegion(top, bottom)
 
 	def load_world(self, filename: str, first_layer: int=0):
 		"""
@@ -662,8 +860,11 @@ class Engine(object):
 		:param filename: main .tmx file to load
 		:first_layer: optional layer index to start to assign, by default 0
 		"""
-		ok =_tln.TLN_LoadWorld(filename, first_layer)
+		ok = _tln.TLN_LoadWorld(_encode_string(filename), first_layer)
 		_raise_exception(ok)
+		# sprites placed by the world are configured natively, the values cached by the wrappers are stale
+		for shadow in _sprite_shadows.values():
+			shadow.reset()
 
 	def set_world_position(self, x: int, y: int):
 		"""
@@ -672,8 +873,7 @@ class Engine(object):
 		:param x: horizontal position in world space
 		:param y: vertical position in world space
 		"""
-		ok = _tln.TLN_SetWorldPosition(x, y)
-		_raise_exception(ok)
+		_tln.TLN_SetWorldPosition(x, y)
 
 	def release_world(self):
 		"""
@@ -683,25 +883,28 @@ class Engine(object):
 
 
 # window management -----------------------------------------------------------
-_tln.TLN_CreateWindow.argtypes = [c_char_p, c_int]
-_tln.TLN_CreateWindow.restype = c_bool
-_tln.TLN_CreateWindowThread.argtypes = [c_char_p, c_int]
-_tln.TLN_CreateWindowThread.restype = c_bool
-_tln.TLN_ProcessWindow.restype = c_bool
-_tln.TLN_IsWindowActive.restype = c_bool
-_tln.TLN_GetInput.argtypes = [c_int]
-_tln.TLN_GetInput.restype = c_bool
-_tln.TLN_EnableInput.argtypes = [c_int, c_bool]
-_tln.TLN_AssignInputJoystick.argtypes = [c_int, c_int]
-_tln.TLN_DefineInputKey.argtypes = [c_int, c_int, c_uint]
-_tln.TLN_DefineInputButton.argtypes = [c_int, c_int, c_ubyte]
-_tln.TLN_DrawFrame.argtypes = [c_int]
-_tln.TLN_EnableCRTEffect.argtypes = [c_int, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_bool, c_ubyte]
-_tln.TLN_ConfigCRTEffect.argtypes = [c_int, c_bool]
-_tln.TLN_GetTicks.restype = c_int
-_tln.TLN_Delay.argtypes = [c_int]
-_tln.TLN_GetWindowWidth.restype = c_int
-_tln.TLN_GetWindowHeight.restype = c_int
+_signatures.update({
+	"TLN_CreateWindow": ([c_char_p, c_int], c_bool),
+	"TLN_CreateWindowThread": ([c_char_p, c_int], c_bool),
+	"TLN_ProcessWindow": (None, c_bool),
+	"TLN_IsWindowActive": (None, c_bool),
+	"TLN_GetInput": ([c_int], c_bool),
+	"TLN_EnableInput": ([c_int, c_bool], None),
+	"TLN_AssignInputJoystick": ([c_int, c_int], None),
+	"TLN_DefineInputKey": ([c_int, c_int, c_uint], None),
+	"TLN_DefineInputButton": ([c_int, c_int, c_ubyte], None),
+	"TLN_DrawFrame": ([c_int], None),
+	"TLN_EnableCRTEffect": ([c_int, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_bool, c_ubyte], None),
+	"TLN_ConfigCRTEffect": ([c_int, c_bool], None),
+	"TLN_GetTicks": (None, c_int),
+	"TLN_Delay": ([c_int], None),
+	"TLN_GetWindowWidth": (None, c_int),
+	"TLN_GetWindowHeight": (None, c_int),
+})
+
+_TLN_DrawFrame = _tln.TLN_DrawFrame
+_TLN_ProcessWindow = _tln.TLN_ProcessWindow
+_TLN_GetInput = _tln.TLN_GetInput
 
 class Window(object):
 	"""
@@ -727,7 +930,7 @@ class Window(object):
 		global _window, _window_created
 
 		"""Added the ability to choose the window title ~AleK3y"""
-		_tln.TLN_SetWindowTitle(_encode_string(str(title)))
+		_tln.TLN_SetWindowTitle(_encode_string(title))
 
 		if _window_created:
 			return _window
@@ -770,9 +973,9 @@ class Window(object):
 		:return: True if window is active or False if the user has requested to end the application
 		(by pressing Esc key or clicking the close button)
 		"""
-		_tln.TLN_DrawFrame(self.num_frame)
+		_TLN_DrawFrame(self.num_frame)
 		self.num_frame += 1
-		return _tln.TLN_ProcessWindow()
+		return _TLN_ProcessWindow()
 
 	def is_active(self) -> bool:
 		"""
@@ -798,7 +1001,7 @@ class Window(object):
 			# check if player 2 is pressing action button 1:
 			value = window.get_input(Input.P2 + Input.BUTTON1)
 		"""
-		return _tln.TLN_GetInput(input_id)
+		return _TLN_GetInput(input_id)
 
 	def enable_input(self, player: int, state: bool):
 		"""
@@ -899,20 +1102,15 @@ class Window(object):
 
 
 # spritesets management -----------------------------------------------------------
-_tln.TLN_CreateSpriteset.argtypes = [c_void_p, POINTER(SpriteData), c_int]
-_tln.TLN_CreateSpriteset.restype = c_void_p
-_tln.TLN_LoadSpriteset.argtypes = [c_char_p]
-_tln.TLN_LoadSpriteset.restype = c_void_p
-_tln.TLN_CloneSpriteset.argtypes = [c_void_p]
-_tln.TLN_CloneSpriteset.restype = c_void_p
-_tln.TLN_GetSpriteInfo.argtypes = [c_void_p, c_int, POINTER(SpriteInfo)]
-_tln.TLN_GetSpriteInfo.restype = c_bool
-_tln.TLN_GetSpritesetPalette.argtypes = [c_void_p]
-_tln.TLN_GetSpritesetPalette.restype = c_void_p
-_tln.TLN_SetSpritesetData.argtypes = [c_void_p, c_int, POINTER(SpriteData), POINTER(c_ubyte), c_int]
-_tln.TLN_SetSpritesetData.restype = c_bool
-_tln.TLN_DeleteSpriteset.argtypes = [c_void_p]
-_tln.TLN_DeleteSpriteset.restype = c_bool
+_signatures.update({
+	"TLN_CreateSpriteset": ([c_void_p, POINTER(SpriteData), c_int], c_void_p, _check_handle),
+	"TLN_LoadSpriteset": ([c_char_p], c_void_p, _check_handle),
+	"TLN_CloneSpriteset": ([c_void_p], c_void_p, _check_handle),
+	"TLN_GetSpriteInfo": ([c_void_p, c_int, POINTER(SpriteInfo)], c_bool),
+	"TLN_GetSpritesetPalette": ([c_void_p], c_void_p),
+	"TLN_SetSpritesetData": ([c_void_p, c_int, POINTER(SpriteData), POINTER(c_ubyte), c_int], c_bool),
+	"TLN_DeleteSpriteset": ([c_void_p], c_bool),
+})
 
 
 class Spriteset(object):
@@ -924,8 +1122,9 @@ class Spriteset(object):
 	def __init__(self, handle: c_void_p, owner: bool=True):
 		self._as_parameter_ = handle
 		self.owner = owner
-		self.library = _tln
+		self._finalizer = _finalize(self, _tln.TLN_DeleteSpriteset, handle) if owner else None
 		self.palette = Palette(_tln.TLN_GetSpritesetPalette(handle), False)
+		self._entries = dict()
 
 	@classmethod
 	def create(cls, bitmap: "Bitmap", sprite_data: POINTER(SpriteData)) -> "Spriteset":
@@ -933,14 +1132,12 @@ class Spriteset(object):
 		Static method that creates an empty spriteset
 
 		:param bitmap: Bitmap object containing the packaged sprite pictures
-		:param sprite_data: list of SpriteData tuples describing each sprite pictures
+		:param sprite_data: list or ctypes array of SpriteData tuples describing each sprite pictures. \
+			Passing a ``(SpriteData * n)`` array avoids a copy
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreateSpriteset(bitmap, sprite_data, len(sprite_data))
-		if handle is not None:
-			return Spriteset(handle)
-		else:
-			_raise_exception()
+		sprite_data = _as_array(SpriteData, sprite_data)
+		return Spriteset(_tln.TLN_CreateSpriteset(bitmap, sprite_data, len(sprite_data)))
 
 	@classmethod
 	def fromfile(cls, filename: str) -> "Spriteset":
@@ -950,11 +1147,7 @@ class Spriteset(object):
 		:param filename: png filename with bitmap data
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_LoadSpriteset(_encode_string(filename))
-		if handle is not None:
-			return Spriteset(handle)
-		else:
-			_raise_exception()
+		return Spriteset(_tln.TLN_LoadSpriteset(_encode_string(filename)))
 
 	def clone(self) -> "Spriteset":
 		"""
@@ -962,11 +1155,7 @@ class Spriteset(object):
 
 		:return: instance of the copy
 		"""
-		handle = _tln.TLN_CloneSpriteset(self)
-		if handle is not None:
-			return Spriteset(handle)
-		else:
-			_raise_exception()
+		return Spriteset(_tln.TLN_CloneSpriteset(self))
 
 	def set_sprite_data(self, entry: int, data: POINTER(SpriteData), pixels: POINTER(c_byte), pitch: int):
 		"""
@@ -978,47 +1167,61 @@ class Spriteset(object):
 		:param pitch: Number of bytes per scanline of the source pixel data
 		"""
 		ok = _tln.TLN_SetSpritesetData(self, entry, data, pixels, pitch)
+		self._entries.clear()
 		_raise_exception(ok)
 
-	def get_sprite_info(self, entry: int, info: POINTER(SpriteInfo)):
+	def find_sprite(self, name: str) -> int:
+		"""
+		Finds a sprite by its name. Found names are remembered, so looking up the same name again
+		doesn't search the spriteset
+
+		:param name: name of the sprite to find
+		:return: sprite index, or -1 if not found
+		"""
+		entry = self._entries.get(name)
+		if entry is None:
+			entry = _tln.TLN_FindSpritesetSprite(self, _encode_string(name))
+			if entry != -1:
+				self._entries[name] = entry
+		return entry
+
+	def get_sprite_info(self, entry: int, info: Optional[POINTER(SpriteInfo)]=None) -> SpriteInfo:
 		"""
 		Gets info about a given sprite into an user-provided SpriteInfo tuple
 
 		:param entry: sprite index to query
-		:param info: SpriteInfo to get the data
+		:param info: optional SpriteInfo to get the data. If not provided, an internal SpriteInfo is reused \
+			and returned, that is overwritten by the next call from the same thread
+		:return: the SpriteInfo with the data
 		"""
+		if info is None:
+			info = _get_scratch(SpriteInfo)
 		ok = _tln.TLN_GetSpriteInfo(self, entry, info)
 		_raise_exception(ok)
+		return info
 
-	def __del__(self):
-		if self.owner:
-			ok = self.library.TLN_DeleteSpriteset(self)
-			_raise_exception(ok)
+	def close(self):
+		"""
+		Deletes the spriteset right away instead of waiting for garbage collection
+		"""
+		if self._finalizer is not None:
+			self._finalizer()
 
 
 # tilesets management ---------------------------------------------------------
-_tln.TLN_CreateTileset.argtypes = [c_int, c_int, c_int, c_void_p, c_void_p, POINTER(TileAttributes)]
-_tln.TLN_CreateTileset.restype = c_void_p
-_tln.TLN_LoadTileset.argtypes = [c_char_p]
-_tln.TLN_LoadTileset.restype = c_void_p
-_tln.TLN_CloneTileset.argtypes = [c_void_p]
-_tln.TLN_CloneTileset.restype = c_void_p
-_tln.TLN_SetTilesetPixels.argtypes = [c_void_p, c_int, POINTER(c_byte), c_int]
-_tln.TLN_SetTilesetPixels.restype = c_bool
-_tln.TLN_GetTileWidth.argtypes = [c_void_p]
-_tln.TLN_GetTileWidth.restype = c_int
-_tln.TLN_GetTileHeight.argtypes = [c_void_p]
-_tln.TLN_GetTileHeight.restype = c_int
-_tln.TLN_GetTilesetNumTiles.argtypes = [c_void_p] 
-_tln.TLN_GetTilesetNumTiles.restype = c_int
-_tln.TLN_GetTilesetPalette.argtypes = [c_void_p]
-_tln.TLN_GetTilesetPalette.restype = c_void_p
-_tln.TLN_GetTilesetSequencePack.argtypes = [c_void_p]
-_tln.TLN_GetTilesetSequencePack.restype = c_void_p
-_tln.TLN_FindSpritesetSprite.argtypes = [c_void_p, c_char_p]
-_tln.TLN_FindSpritesetSprite.restype = c_int
-_tln.TLN_DeleteTileset.argtypes = [c_void_p]
-_tln.TLN_DeleteTileset.restype = c_bool
+_signatures.update({
+	"TLN_CreateTileset": ([c_int, c_int, c_int, c_void_p, c_void_p, POINTER(TileAttributes)], c_void_p, _check_handle),
+	"TLN_LoadTileset": ([c_char_p], c_void_p, _check_handle),
+	"TLN_CloneTileset": ([c_void_p], c_void_p, _check_handle),
+	"TLN_SetTilesetPixels": ([c_void_p, c_int, POINTER(c_byte), c_int], c_bool),
+	"TLN_GetTileWidth": ([c_void_p], c_int),
+	"TLN_GetTileHeight": ([c_void_p], c_int),
+	"TLN_GetTilesetNumTiles": ([c_void_p], c_int),
+	"TLN_GetTilesetPalette": ([c_void_p], c_void_p),
+	"TLN_GetTilesetSequencePack": ([c_void_p], c_void_p),
+	"TLN_FindSpritesetSprite": ([c_void_p, c_char_p], c_int),
+	"TLN_DeleteTileset": ([c_void_p], c_bool),
+})
 
 
 class Tileset(object):
@@ -1034,12 +1237,28 @@ class Tileset(object):
 	def __init__(self, handle: c_void_p, owner: bool=True):
 		self._as_parameter_ = handle
 		self.owner = owner
-		self.library = _tln
-		self.tile_width = _tln.TLN_GetTileWidth(handle)
-		self.tile_height = _tln.TLN_GetTileHeight(handle)
-		self.num_tiles = _tln.TLN_GetTilesetNumTiles(handle)
-		self.palette = Palette(_tln.TLN_GetTilesetPalette(handle), False)
-		self.sequence_pack = SequencePack(_tln.TLN_GetTilesetSequencePack(handle), False)
+		self._finalizer = _finalize(self, _tln.TLN_DeleteTileset, handle) if owner else None
+
+	# attributes are queried on first access only, so loading a resource doesn't pay for unused ones
+	@cached_property
+	def tile_width(self) -> int:
+		return _tln.TLN_GetTileWidth(self)
+
+	@cached_property
+	def tile_height(self) -> int:
+		return _tln.TLN_GetTileHeight(self)
+
+	@cached_property
+	def num_tiles(self) -> int:
+		return _tln.TLN_GetTilesetNumTiles(self)
+
+	@cached_property
+	def palette(self) -> "Palette":
+		return Palette(_tln.TLN_GetTilesetPalette(self), False)
+
+	@cached_property
+	def sequence_pack(self) -> "SequencePack":
+		return SequencePack(_tln.TLN_GetTilesetSequencePack(self), False)
 
 	@classmethod
 	def create(cls, num_tiles: int, width: int, height: int, palette: "Palette", sequence_pack: Optional["SequencePack"]=None, attributes: Optional[POINTER(TileAttributes)]=None) -> "Tileset":
@@ -1054,11 +1273,7 @@ class Tileset(object):
 		:param attributes: Optional list of TileAttributes, one element per tile in the tileset
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreateTileset(num_tiles, width, height, palette, sequence_pack, attributes)
-		if handle is not None:
-			return Tileset(handle)
-		else:
-			_raise_exception()
+		return Tileset(_tln.TLN_CreateTileset(num_tiles, width, height, palette, sequence_pack, attributes))
 
 	@classmethod
 	def fromfile(cls, filename: str) -> "Tileset":
@@ -1068,11 +1283,7 @@ class Tileset(object):
 		:param filename: TSX file with the tileset
 		:return:
 		"""
-		handle = _tln.TLN_LoadTileset(_encode_string(filename))
-		if handle is not None:
-			return Tileset(handle)
-		else:
-			_raise_exception()
+		return Tileset(_tln.TLN_LoadTileset(_encode_string(filename)))
 
 	def clone(self) -> "Tileset":
 		"""
@@ -1080,11 +1291,7 @@ class Tileset(object):
 
 		:return: instance of the copy
 		"""
-		handle = _tln.TLN_CloneTileset(self)
-		if handle is not None:
-			return Tileset(handle)
-		else:
-			_raise_exception()
+		return Tileset(_tln.TLN_CloneTileset(self))
 
 	def set_pixels(self, entry: int, data: POINTER(c_byte), pitch: int):
 		"""
@@ -1097,35 +1304,40 @@ class Tileset(object):
 		ok = _tln.TLN_SetTilesetPixels(self, entry, data, pitch)
 		_raise_exception(ok)
 
-	def __del__(self):
-		if self.owner:
-			ok = self.library.TLN_DeleteTileset(self)
-			_raise_exception(ok)
+	def view(self) -> "Tileset":
+		"""
+		Returns a lightweight reference to the same tileset, sharing its graphic data instead of copying it like
+		:meth:`Tileset.clone`. Changes made through either object affect both
+
+		:return: non-owning Tileset object
+		"""
+		return _make_view(self)
+
+	def close(self):
+		"""
+		Deletes the tileset right away instead of waiting for garbage collection
+		"""
+		if self._finalizer is not None:
+			self._finalizer()
 
 
 # tilemaps management ---------------------------------------------------------
-_tln.TLN_CreateTilemap.argtypes = [c_int, c_int, POINTER(Tile), c_int, c_void_p]
-_tln.TLN_CreateTilemap.restype = c_void_p
-_tln.TLN_LoadTilemap.argtypes = [c_char_p]
-_tln.TLN_LoadTilemap.restype = c_void_p
-_tln.TLN_CloneTilemap.argtypes = [c_void_p]
-_tln.TLN_CloneTilemap.restype = c_void_p
-_tln.TLN_GetTilemapRows.argtypes = [c_void_p]
-_tln.TLN_GetTilemapRows.restype = c_int
-_tln.TLN_GetTilemapCols.argtypes = [c_void_p]
-_tln.TLN_GetTilemapCols.restype = c_int
-_tln.TLN_SetTilemapTileset2.argtypes = [c_void_p, c_void_p, c_int]
-_tln.TLN_SetTilemapTileset2.restype = c_bool
-_tln.TLN_GetTilemapTileset2.argtypes = [c_void_p, c_int]
-_tln.TLN_GetTilemapTileset2.restype = c_void_p
-_tln.TLN_GetTilemapTile.argtypes = [c_void_p, c_int, c_int, POINTER(Tile)]
-_tln.TLN_GetTilemapTile.restype = c_bool
-_tln.TLN_SetTilemapTile.argtypes = [c_void_p, c_int, c_int, POINTER(Tile)]
-_tln.TLN_SetTilemapTile.restype = c_bool
-_tln.TLN_CopyTiles.argtypes = [c_void_p, c_int, c_int, c_int, c_int, c_void_p, c_int, c_int]
-_tln.TLN_CopyTiles.restype = c_bool
-_tln.TLN_DeleteTilemap.argtypes = [c_void_p]
-_tln.TLN_DeleteTilemap.restype = c_bool
+_signatures.update({
+	"TLN_CreateTilemap": ([c_int, c_int, POINTER(Tile), c_int, c_void_p], c_void_p, _check_handle),
+	"TLN_LoadTilemap": ([c_char_p, c_char_p], c_void_p, _check_handle),
+	"TLN_CloneTilemap": ([c_void_p], c_void_p, _check_handle),
+	"TLN_GetTilemapRows": ([c_void_p], c_int),
+	"TLN_GetTilemapCols": ([c_void_p], c_int),
+	"TLN_SetTilemapTileset2": ([c_void_p, c_void_p, c_int], c_bool),
+	"TLN_GetTilemapTileset2": ([c_void_p, c_int], c_void_p),
+	"TLN_GetTilemapTile": ([c_void_p, c_int, c_int, POINTER(Tile)], c_bool),
+	"TLN_SetTilemapTile": ([c_void_p, c_int, c_int, POINTER(Tile)], c_bool),
+	"TLN_CopyTiles": ([c_void_p, c_int, c_int, c_int, c_int, c_void_p, c_int, c_int], c_bool),
+	"TLN_DeleteTilemap": ([c_void_p], c_bool),
+})
+
+_TLN_GetTilemapTile = _tln.TLN_GetTilemapTile
+_TLN_SetTilemapTile = _tln.TLN_SetTilemapTile
 
 
 class Tilemap(object):
@@ -1139,14 +1351,23 @@ class Tilemap(object):
 	def __init__(self, handle: c_void_p, owner: bool=True):
 		self._as_parameter_ = handle
 		self.owner = owner
-		self.library = _tln
-		self.rows = _tln.TLN_GetTilemapRows(handle)
-		self.cols = _tln.TLN_GetTilemapCols(handle)
-		tileset_handle = _tln.TLN_GetTilemapTileset2(handle, 0)
+		self._finalizer = _finalize(self, _tln.TLN_DeleteTilemap, handle) if owner else None
+
+	@cached_property
+	def rows(self) -> int:
+		return _tln.TLN_GetTilemapRows(self)
+
+	@cached_property
+	def cols(self) -> int:
+		return _tln.TLN_GetTilemapCols(self)
+
+	@cached_property
+	def tileset(self) -> Optional[Tileset]:
+		tileset_handle = _tln.TLN_GetTilemapTileset2(self, 0)
 		if tileset_handle is not None:
-			self.tileset = Tileset(tileset_handle, False)
+			return Tileset(tileset_handle, False)
 		else:
-			self.tileset = None
+			return None
 
 	@classmethod
 	def create(cls, rows: int, cols: int, tiles: POINTER(Tile), background_color: int=0, tileset: Optional[Tileset]=None) -> "Tilemap":
@@ -1155,16 +1376,14 @@ class Tilemap(object):
 
 		:param rows: Number of rows (vertical dimension)
 		:param cols: Number of cols (horizontal dimension)
-		:param tiles: List of Tile objects with tile data
+		:param tiles: List or ctypes array of Tile objects with tile data, or any object exposing a buffer of \
+			packed tiles that is passed without per-tile conversion, like a numpy array of \
+			dtype [('index', numpy.uint16), ('flags', numpy.uint16)]
 		:param background_color: optional Color object with default background color
 		:param tileset: Optional reference to associated tileset
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreateTilemap(rows, cols, tiles, background_color, tileset)
-		if handle is not None:
-			return Tilemap(handle)
-		else:
-			_raise_exception()
+		return Tilemap(_tln.TLN_CreateTilemap(rows, cols, _as_array(Tile, tiles), background_color, tileset))
 
 	@classmethod
 	def fromfile(cls, filename: str, layer_name: Optional[str]=None) -> "Tilemap":
@@ -1176,11 +1395,7 @@ class Tilemap(object):
 			By default it loads the first layer inside the TMX
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_LoadTilemap(_encode_string(filename), _encode_string(layer_name))
-		if handle is not None:
-			return Tilemap(handle)
-		else:
-			_raise_exception()
+		return Tilemap(_tln.TLN_LoadTilemap(_encode_string(filename), _encode_string(layer_name)))
 
 	def clone(self) -> "Tilemap":
 		"""
@@ -1188,11 +1403,7 @@ class Tilemap(object):
 
 		:return: instance of the copy
 		"""
-		handle = _tln.TLN_CloneTilemap(self)
-		if handle is not None:
-			return Tilemap(handle)
-		else:
-			_raise_exception()
+		return Tilemap(_tln.TLN_CloneTilemap(self))
 
 	def get_tileset(self, index: int=0) -> Tileset:
 		"""
@@ -1210,18 +1421,23 @@ class Tilemap(object):
 		ok = _tln.TLN_SetTilemapTileset2(self, tileset, index)
 		_raise_exception(ok)
 
-	def get_tile(self, row: int, col: int, tile_info: POINTER(TileInfo)):
+	def get_tile(self, row: int, col: int, tile_info: Optional[POINTER(Tile)]=None) -> Tile:
 		"""
 		Gets data about a given tile
 
 		:param row: Vertical position of the tile (0 <= row < rows)
 		:param col: Horizontal position of the tile (0 <= col < cols)
-		:param tile_info: pointer to user-provided :class:`TileInfo` object where to get the data
+		:param tile_info: optional user-provided :class:`Tile` object where to get the data. If not provided, \
+			an internal Tile is reused and returned, that is overwritten by the next call from the same thread
+		:return: the Tile with the data
 		"""
-		ok = _tln.TLN_GetTilemapTile(self, row, col, tile_info)
+		if tile_info is None:
+			tile_info = _get_scratch(Tile)
+		ok = _TLN_GetTilemapTile(self, row, col, tile_info)
 		_raise_exception(ok)
+		return tile_info
 
-	def set_tile(self, row: int, col: int, tile_info: Optional[POINTER(TileInfo)]):
+	def set_tile(self, row: int, col: int, tile_info: Optional[POINTER(Tile)]):
 		"""
 		Sets a tile inside the tilemap
 
@@ -1229,15 +1445,49 @@ class Tilemap(object):
 		:param col: Horizontal position of the tile (0 <= col < cols)
 		:param tile_info: pointer to user-provided :class:`Tile` object, or None to erase
 		"""
-		if tile_info is not None:
-			ok = _tln.TLN_SetTilemapTile(self, row, col, tile_info)
-		else:
-			tile_info = Tile()
-			tile_info.index = 0
-			ok = _tln.TLN_SetTilemapTile(self, row, col, tile_info)
-			del tile_info
+		ok = _TLN_SetTilemapTile(self, row, col, tile_info or _ZERO_TILE)
 		_raise_exception(ok)
 
+	def set_tiles(self, row: int, col: int, num_rows: int, num_cols: int, tiles: POINTER(Tile)):
+		"""
+		Sets a rectangular block of tiles inside the tilemap with a single bulk copy, instead of calling
+		:meth:`Tilemap.set_tile` for each cell
+
+		:param row: Starting row (vertical position) inside the tilemap
+		:param col: Starting column (horizontal position) inside the tilemap
+		:param num_rows: Number of rows of the block
+		:param num_cols: Number of columns of the block
+		:param tiles: list, ctypes array or buffer of num_rows*num_cols Tile objects, ordered row by row. \
+			A ValueError is raised when it holds a different number of tiles. Raw pointers can't be checked \
+			and raise TypeError
+		"""
+		tiles = _as_array(Tile, tiles)
+		if not isinstance(tiles, Array):
+			raise TypeError("tiles must be a list, ctypes array or buffer, not %s" % type(tiles).__name__)
+		if sizeof(tiles) != num_rows * num_cols * sizeof(Tile):
+			raise ValueError("expected %d tiles, got %d" % (num_rows * num_cols, sizeof(tiles) // sizeof(Tile)))
+		self._paste_block(row, col, num_rows, num_cols, tiles)
+
+	def clear_region(self, row: int, col: int, num_rows: int, num_cols: int):
+		"""
+		Erases a rectangular block of tiles inside the tilemap with a single bulk copy
+
+		:param row: Starting row (vertical position) inside the tilemap
+		:param col: Starting column (horizontal position) inside the tilemap
+		:param num_rows: Number of rows to erase
+		:param num_cols: Number of columns to erase
+		"""
+		self._paste_block(row, col, num_rows, num_cols, None)
+
+	# copies tiles into the tilemap through a temporary native block, that starts empty when tiles is None.
+	# The block is released even if the copy fails
+	def _paste_block(self, row, col, num_rows, num_cols, tiles):
+		block = Tilemap.create(num_rows, num_cols, tiles)
+		try:
+			block.copy_tiles(0, 0, num_rows, num_cols, self, row, col)
+		finally:
+			block.close()
+
 	def copy_tiles(self, src_row: int, src_col: int, num_rows: int, num_cols: int, dst_tilemap: "Tilemap", dst_row: int, dst_col: int):
 		"""
 		Copies blocks of tiles between two tilemaps
@@ -1253,43 +1503,52 @@ class Tilemap(object):
 		ok = _tln.TLN_CopyTiles(self, src_row, src_col, num_rows, num_cols, dst_tilemap, dst_row, dst_col)
 		_raise_exception(ok)
 
-	def __del__(self):
-		if self.owner:
-			ok = self.library.TLN_DeleteTilemap(self)
-			_raise_exception(ok)
+	def _set_background_color(self):
+		_tln.TLN_SetBGColorFromTilemap(self)
+
+	def view(self) -> "Tilemap":
+		"""
+		Returns a lightweight reference to the same tilemap, sharing its tile data instead of copying it like
+		:meth:`Tilemap.clone`. Changes made through either object affect both
+
+		:return: non-owning Tilemap object
+		"""
+		return _make_view(self)
+
+	def close(self):
+		"""
+		Deletes the tilemap right away instead of waiting for garbage collection
+		"""
+		if self._finalizer is not None:
+			self._finalizer()
 
 
 # color tables management -----------------------------------------------------
-_tln.TLN_CreatePalette.argtypes = [c_int]
-_tln.TLN_CreatePalette.restype = c_void_p
-_tln.TLN_LoadPalette.argtypes = [c_char_p]
-_tln.TLN_LoadPalette.restype = c_void_p
-_tln.TLN_ClonePalette.argtypes = [c_void_p]
-_tln.TLN_ClonePalette.restype = c_void_p
-_tln.TLN_SetPaletteColor.argtypes = [c_void_p, c_int, c_ubyte, c_ubyte, c_ubyte]
-_tln.TLN_SetPaletteColor.restype = c_bool
-_tln.TLN_MixPalettes.argtypes = [c_void_p, c_void_p, c_void_p, c_ubyte]
-_tln.TLN_MixPalettes.restype = c_bool
-_tln.TLN_AddPaletteColor.argtypes = [c_void_p, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte]
-_tln.TLN_AddPaletteColor.restype = c_bool
-_tln.TLN_SubPaletteColor.argtypes = [c_void_p, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte]
-_tln.TLN_SubPaletteColor.restype = c_bool
-_tln.TLN_ModPaletteColor.argtypes = [c_void_p, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte]
-_tln.TLN_ModPaletteColor.restype = c_bool
-_tln.TLN_GetPaletteData.argtypes = [c_void_p, c_int]
-_tln.TLN_GetPaletteData.restype = POINTER(c_ubyte)
-_tln.TLN_DeletePalette.argtypes = [c_void_p]
-_tln.TLN_DeletePalette.restype = c_bool
+_signatures.update({
+	"TLN_CreatePalette": ([c_int], c_void_p, _check_handle),
+	"TLN_LoadPalette": ([c_char_p], c_void_p, _check_handle),
+	"TLN_ClonePalette": ([c_void_p], c_void_p, _check_handle),
+	"TLN_SetPaletteColor": ([c_void_p, c_int, c_ubyte, c_ubyte, c_ubyte], c_bool),
+	"TLN_MixPalettes": ([c_void_p, c_void_p, c_void_p, c_ubyte], c_bool),
+	"TLN_AddPaletteColor": ([c_void_p, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte], c_bool),
+	"TLN_SubPaletteColor": ([c_void_p, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte], c_bool),
+	"TLN_ModPaletteColor": ([c_void_p, c_ubyte, c_ubyte, c_ubyte, c_ubyte, c_ubyte], c_bool),
+	"TLN_GetPaletteData": ([c_void_p, c_int], POINTER(c_ubyte)),
+	"TLN_DeletePalette": ([c_void_p], c_bool),
+})
+
+_TLN_SetPaletteColor = _tln.TLN_SetPaletteColor
 
 
 class Palette(object):
 	"""
 	The Palette object holds the color tables used by tileesets and spritesets to render sprites and backgrounds
 	"""
-	def __init__(self, handle: c_void_p, owner:bool = True):
+	def __init__(self, handle: c_void_p, owner:bool = True, num_entries: Optional[int] = None):
 		self._as_parameter_ = handle
 		self.owner = owner
-		self.library = _tln
+		self._num_entries = num_entries		# size of the color table when known, to bound the views of get_data
+		self._finalizer = _finalize(self, _tln.TLN_DeletePalette, handle) if owner else None
 
 	@classmethod
 	def create(cls, num_entries: int=256) -> "Palette":
@@ -1299,11 +1558,7 @@ class Palette(object):
 		:param num_entries: optional number of colors to hold (up to 256, default value)
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreatePalette(num_entries)
-		if handle is not None:
-			return Palette(handle)
-		else:
-			_raise_exception()
+		return Palette(_tln.TLN_CreatePalette(num_entries), True, num_entries)
 
 	@classmethod
 	def fromfile(cls, filename: str) -> "Palette":
@@ -1313,11 +1568,7 @@ class Palette(object):
 		:param filename: name of the .act file to load
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_LoadPalette(_encode_string(filename))
-		if handle is not None:
-			return Palette(handle)
-		else:
-			_raise_exception()
+		return Palette(_tln.TLN_LoadPalette(_encode_string(filename)))
 
 	def clone(self) -> "Palette":
 		"""
@@ -1325,11 +1576,7 @@ class Palette(object):
 
 		:return: instance of the copy
 		"""
-		handle = _tln.TLN_ClonePalette(self)
-		if handle is not None:
-			return Palette(handle)
-		else:
-			_raise_exception()
+		return Palette(_tln.TLN_ClonePalette(self), True, self._num_entries)
 
 	def set_color(self, entry: int, color: Color):
 		"""
@@ -1338,7 +1585,7 @@ class Palette(object):
 		:param entry: Index of the palette entry to modify (0-255)
 		:param color: Color object with the r,g,b components of the color
 		"""
-		ok = _tln.TLN_SetPaletteColor(self, entry, color.r, color.g, color.b)
+		ok = _TLN_SetPaletteColor(self, entry, color.r, color.g, color.b)
 		_raise_exception(ok)
 
 	def mix(self, src_palette1: "Palette", src_palette2: "Palette", factor: int):
@@ -1352,6 +1599,49 @@ class Palette(object):
 		ok = _tln.TLN_MixPalettes(src_palette1, src_palette2, self, factor)
 		_raise_exception(ok)
 
+	def get_data(self, entry: int=0, count: Optional[int]=None) -> Array:
+		"""
+		Returns a writable view of the color table that shares memory with the palette, for bulk processing
+		without a library call per entry. Each item is a 32-bit 0xAARRGGBB word. The view supports the buffer
+		protocol, so it can be wrapped without copies by memoryview, array or numpy.frombuffer
+
+		:param entry: First palette entry of the view
+		:param count: Number of entries in the view, by default up to the end of the palette. Required when the \
+			size of the palette isn't known, as with palettes loaded from file or owned by other objects
+		:return: ctypes array of count c_uint32 items, that keeps the palette alive
+		:raises ValueError: if the range falls outside the palette
+		"""
+		num_entries = self._num_entries
+		if count is None:
+			if num_entries is None:
+				raise ValueError("count is required for palettes of unknown size")
+			count = num_entries - entry
+		if entry < 0 or count <= 0 or (num_entries is not None and entry + count > num_entries):
+			raise ValueError("entry %d, count %d outside palette of %s entries" % (entry, count, num_entries))
+		data = _tln.TLN_GetPaletteData(self, entry)
+		if not data:
+			_raise_exception()
+		view = (c_uint32 * count).from_address(addressof(data.contents))
+		view._palette = self
+		return view
+
+	def set_gradient(self, first: int, last: int, color1: Color, color2: Color):
+		"""
+		Fills a range of entries with a linear gradient between two colors, in a single pass over the color table
+
+		:param first: Index of the first entry, that gets color1
+		:param last: Index of the last entry, that gets color2
+		:param color1: Color object with the starting color
+		:param color2: Color object with the ending color
+		"""
+		view = self.get_data(first, last - first + 1)
+		span = max(last - first, 1)
+		for index in range(len(view)):
+			r = color1.r + (color2.r - color1.r) * index // span
+			g = color1.g + (color2.g - color1.g) * index // span
+			b = color1.b + (color2.b - color1.b) * index // span
+			view[index] = (view[index] & 0xFF000000) | (r << 16) | (g << 8) | b
+
 	def add_color(self, first: int, count: int, color: Color):
 		"""
 		Modifies a range of colors by adding the provided color value to the selected range.
@@ -1388,33 +1678,38 @@ class Palette(object):
 		ok = _tln.TLN_ModPaletteColor(self, first, count, color.r, color.g, color.b)
 		_raise_exception(ok)
 
-	def __del__(self):
-		if self.owner:
-			ok = self.library.TLN_DeletePalette(self)
-			_raise_exception(ok)
+	def view(self) -> "Palette":
+		"""
+		Returns a lightweight reference to the same palette, sharing its color table instead of copying it like
+		:meth:`Palette.clone`. Changes made through either object affect both
+
+		:return: non-owning Palette object
+		"""
+		view = _make_view(self)
+		view._num_entries = self._num_entries
+		return view
+
+	def close(self):
+		"""
+		Deletes the palette right away instead of waiting for garbage collection
+		"""
+		if self._finalizer is not None:
+			self._finalizer()
 
 
 # bitmaps ---------------------------------------------------------------------
-_tln.TLN_CreateBitmap.argtypes = [c_int, c_int, c_int]
-_tln.TLN_CreateBitmap.restype = c_void_p
-_tln.TLN_LoadBitmap.argtypes = [c_char_p]
-_tln.TLN_LoadBitmap.restype = c_void_p
-_tln.TLN_CloneBitmap.argtypes = [c_void_p]
-_tln.TLN_CloneBitmap.restype = c_void_p
-_tln.TLN_GetBitmapPtr.argtypes = [c_void_p, c_int, c_int]
-_tln.TLN_GetBitmapPtr.restype = POINTER(c_ubyte)
-_tln.TLN_GetBitmapWidth.argtypes = [c_void_p]
-_tln.TLN_GetBitmapWidth.restype = c_int
-_tln.TLN_GetBitmapHeight.argtypes = [c_void_p]
-_tln.TLN_GetBitmapHeight.restype = c_int
-_tln.TLN_GetBitmapDepth.argtypes = [c_void_p]
-_tln.TLN_GetBitmapDepth.restype = c_int
-_tln.TLN_GetBitmapPitch.argtypes = [c_void_p]
-_tln.TLN_GetBitmapPitch.restype = c_int
-_tln.TLN_GetBitmapPalette.argtypes = [c_void_p]
-_tln.TLN_GetBitmapPalette.restype = c_void_p
-_tln.TLN_DeleteBitmap.argtypes = [c_void_p]
-_tln.TLN_DeleteBitmap.restype = c_bool
+_signatures.update({
+	"TLN_CreateBitmap": ([c_int, c_int, c_int], c_void_p, _check_handle),
+	"TLN_LoadBitmap": ([c_char_p], c_void_p, _check_handle),
+	"TLN_CloneBitmap": ([c_void_p], c_void_p, _check_handle),
+	"TLN_GetBitmapPtr": ([c_void_p, c_int, c_int], POINTER(c_ubyte)),
+	"TLN_GetBitmapWidth": ([c_void_p], c_int),
+	"TLN_GetBitmapHeight": ([c_void_p], c_int),
+	"TLN_GetBitmapDepth": ([c_void_p], c_int),
+	"TLN_GetBitmapPitch": ([c_void_p], c_int),
+	"TLN_GetBitmapPalette": ([c_void_p], c_void_p),
+	"TLN_DeleteBitmap": ([c_void_p], c_bool),
+})
 
 
 class Bitmap(object):
@@ -1430,12 +1725,27 @@ class Bitmap(object):
 	def __init__(self, handle: c_void_p, owner=True):
 		self._as_parameter_ = handle
 		self.owner = owner
-		self.library = _tln
-		self.width = _tln.TLN_GetBitmapWidth(handle)
-		self.height = _tln.TLN_GetBitmapHeight(handle)
-		self.depth = _tln.TLN_GetBitmapDepth(handle)
-		self.pitch = _tln.TLN_GetBitmapPitch(handle)
-		self.palette = Palette(_tln.TLN_GetBitmapPalette(handle), False)
+		self._finalizer = _finalize(self, _tln.TLN_DeleteBitmap, handle) if owner else None
+
+	@cached_property
+	def width(self) -> int:
+		return _tln.TLN_GetBitmapWidth(self)
+
+	@cached_property
+	def height(self) -> int:
+		return _tln.TLN_GetBitmapHeight(self)
+
+	@cached_property
+	def depth(self) -> int:
+		return _tln.TLN_GetBitmapDepth(self)
+
+	@cached_property
+	def pitch(self) -> int:
+		return _tln.TLN_GetBitmapPitch(self)
+
+	@cached_property
+	def palette(self) -> "Palette":
+		return Palette(_tln.TLN_GetBitmapPalette(self), False)
 
 	@classmethod
 	def create(cls, width: int, height: int, bpp: int=8) -> "Bitmap":
@@ -1447,11 +1757,7 @@ class Bitmap(object):
 		:param bpp: Optional bits per pixel (8 by default)
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreateBitmap(width, height, bpp)
-		if handle is not None:
-			return Bitmap(handle)
-		else:
-			_raise_exception()
+		return Bitmap(_tln.TLN_CreateBitmap(width, height, bpp))
 
 	@classmethod
 	def fromfile(cls, filename: str) -> "Bitmap":
@@ -1461,11 +1767,7 @@ class Bitmap(object):
 		:param filename: name of the file to load (.bmp or .png)
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_LoadBitmap(_encode_string(filename))
-		if handle is not None:
-			return Bitmap(handle)
-		else:
-			_raise_exception()
+		return Bitmap(_tln.TLN_LoadBitmap(_encode_string(filename)))
 
 	def clone(self) -> "Bitmap":
 		"""
@@ -1473,11 +1775,7 @@ class Bitmap(object):
 
 		:return: instance of the copy
 		"""
-		handle = _tln.TLN_CloneBitmap(self)
-		if handle is not None:
-			return Bitmap(handle)
-		else:
-			_raise_exception()
+		return Bitmap(_tln.TLN_CloneBitmap(self))
 
 	def get_data(self, x: int, y: int) -> c_void_p:
 		"""
@@ -1489,10 +1787,28 @@ class Bitmap(object):
 		"""
 		return _tln.TLN_GetBitmapPtr(self, x, y)
 
-	def __del__(self):
-		if self.owner:
-			ok = self.library.TLN_DeleteBitmap(self)
-			_raise_exception(ok)
+	def get_buffer(self) -> Array:
+		"""
+		Returns a writable view of the whole pixel data that shares memory with the bitmap, for bulk processing
+		without a library call per pixel. The view holds height scanlines of pitch bytes each and supports the
+		buffer protocol, so it can be wrapped without copies, for example with
+		numpy.frombuffer(buffer, numpy.uint8).reshape(height, pitch)
+
+		:return: ctypes array of pitch*height c_ubyte items, that keeps the bitmap alive
+		"""
+		data = _tln.TLN_GetBitmapPtr(self, 0, 0)
+		if not data:
+			_raise_exception()
+		buffer = (c_ubyte * (self.pitch * self.height)).from_address(addressof(data.contents))
+		buffer._bitmap = self
+		return buffer
+
+	def close(self):
+		"""
+		Deletes the bitmap right away instead of waiting for garbage collection
+		"""
+		if self._finalizer is not None:
+			self._finalizer()
 
 class ObjectList(object):
 	"""
@@ -1501,18 +1817,14 @@ class ObjectList(object):
 
 
 # sequences management --------------------------------------------------------
-_tln.TLN_CreateSequence.argtypes = [c_char_p, c_int, c_int, POINTER(SequenceFrame)]
-_tln.TLN_CreateSequence.restype = c_void_p
-_tln.TLN_CreateCycle.argtypes = [c_char_p, c_int, POINTER(ColorStrip)]
-_tln.TLN_CreateCycle.restype = c_void_p
-_tln.TLN_CreateSpriteSequence.argtypes = [c_char_p, c_void_p, c_char_p, c_int]
-_tln.TLN_CreateSpriteSequence.restype = c_void_p
-_tln.TLN_CloneSequence.argtypes = [c_void_p]
-_tln.TLN_CloneSequence.restype = c_void_p
-_tln.TLN_GetSequenceInfo.argtypes = [c_void_p, POINTER(SequenceInfo)]
-_tln.TLN_GetSequenceInfo.restype = c_bool
-_tln.TLN_DeleteSequence.argtypes = [c_void_p]
-_tln.TLN_DeleteSequence.restype = c_bool
+_signatures.update({
+	"TLN_CreateSequence": ([c_char_p, c_int, c_int, POINTER(SequenceFrame)], c_void_p, _check_handle),
+	"TLN_CreateCycle": ([c_char_p, c_int, POINTER(ColorStrip)], c_void_p, _check_handle),
+	"TLN_CreateSpriteSequence": ([c_char_p, c_void_p, c_char_p, c_int], c_void_p, _check_handle),
+	"TLN_CloneSequence": ([c_void_p], c_void_p, _check_handle),
+	"TLN_GetSequenceInfo": ([c_void_p, POINTER(SequenceInfo)], c_bool),
+	"TLN_DeleteSequence": ([c_void_p], c_bool),
+})
 
 
 class Sequence(object):
@@ -1522,7 +1834,7 @@ class Sequence(object):
 	def __init__(self, handle: c_void_p, owner: bool=True):
 		self._as_parameter_ = handle
 		self.owner = owner
-		self.library = _tln
+		self._finalizer = _finalize(self, _tln.TLN_DeleteSequence, handle) if owner else None
 
 	@classmethod
 	def create_sequence(cls, name: str, target: int, frames: List[SequenceFrame]) -> "Sequence":
@@ -1534,11 +1846,7 @@ class Sequence(object):
 		:param frames: List with SequenceFrame objects, one for each frame of animation
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreateSequence(_encode_string(name), target, len(frames), frames)
-		if handle is not None:
-			return Sequence(handle)
-		else:
-			_raise_exception()
+		return Sequence(_tln.TLN_CreateSequence(_encode_string(name), target, len(frames), frames))
 
 	@classmethod
 	def create_cycle(cls, name: str, strips: List[ColorStrip]) -> "Sequence":
@@ -1549,11 +1857,7 @@ class Sequence(object):
 		:param strips: List with ColorStrip objects, one for each frame of animation
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreateCycle(_encode_string(name), len(strips), strips)
-		if handle is not None:
-			return Sequence(handle)
-		else:
-			_raise_exception()
+		return Sequence(_tln.TLN_CreateCycle(_encode_string(name), len(strips), strips))
 
 	@classmethod
 	def create_sprite_sequence(cls, spriteset: Spriteset, basename: str, delay: int) -> "Sequence":
@@ -1565,11 +1869,7 @@ class Sequence(object):
 		:param delay: Number of frames to hold each animation frame
 		:return: created Sequence object or None if error
 		"""
-		handle = _tln.TLN_CreateSpriteSequence(None, spriteset, _encode_string(basename), delay)
-		if handle is not None:
-			return Sequence(handle)
-		else:
-			_raise_exception()
+		return Sequence(_tln.TLN_CreateSpriteSequence(None, spriteset, _encode_string(basename), delay))
 
 	def clone(self) -> "Sequence":
 		"""
@@ -1577,40 +1877,67 @@ class Sequence(object):
 
 		:return: instance of the copy
 		"""
-		handle = _tln.TLN_CloneSequence(self)
-		if handle is not None:
-			return Sequence(handle)
-		else:
-			_raise_exception()
+		return Sequence(_tln.TLN_CloneSequence(self))
 
-	def get_info(self, info: POINTER(SequenceInfo)):
+	def get_info(self, info: Optional[POINTER(SequenceInfo)]=None) -> SequenceInfo:
 		"""
 		Returns runtime info about a given sequence
 
-		:param info: user-provided SequenceInfo structure to hold the returned data
+		:param info: optional user-provided SequenceInfo structure to hold the returned data. If not provided, \
+			an internal SequenceInfo is reused and returned, that is overwritten by the next call from the same thread
+		:return: the SequenceInfo with the data
 		"""
-		return _tln.TLN_GetSequenceInfo(self, info)
+		if info is None:
+			info = _get_scratch(SequenceInfo)
+		ok = _tln.TLN_GetSequenceInfo(self, info)
+		_raise_exception(ok)
+		return info
 
-	def __del__(self):
-		if self.owner:
-			ok = self.library.TLN_DeleteSequence(self)
-			_raise_exception(ok)
+	def close(self):
+		"""
+		Deletes the sequence right away instead of waiting for garbage collection
+		"""
+		if self._finalizer is not None:
+			self._finalizer()
 
 
 # sequence pack management --------------------------------------------------------
-_tln.TLN_CreateSequencePack.restype = c_void_p
-_tln.TLN_LoadSequencePack.argtypes = [c_char_p]
-_tln.TLN_LoadSequencePack.restype = c_void_p
-_tln.TLN_FindSequence.argtypes = [c_void_p, c_char_p]
-_tln.TLN_FindSequence.restype = c_void_p
-_tln.TLN_GetSequence.argtypes = [c_void_p]
-_tln.TLN_GetSequence.restype = c_void_p
-_tln.TLN_GetSequencePackCount.argtypes = [c_void_p]
-_tln.TLN_GetSequencePackCount.restype = c_int
-_tln.TLN_AddSequenceToPack.argtypes = [c_void_p, c_void_p]
-_tln.TLN_AddSequenceToPack.restype = c_bool
-_tln.TLN_DeleteSequencePack.argtypes = [c_void_p]
-_tln.TLN_DeleteSequencePack.restype = c_bool
+_signatures.update({
+	"TLN_CreateSequencePack": (None, c_void_p, _check_handle),
+	"TLN_LoadSequencePack": ([c_char_p], c_void_p, _check_handle),
+	"TLN_FindSequence": ([c_void_p, c_char_p], c_void_p),
+	"TLN_GetSequence": ([c_void_p], c_void_p),
+	"TLN_GetSequencePackCount": ([c_void_p], c_int),
+	"TLN_AddSequenceToPack": ([c_void_p, c_void_p], c_bool),
+	"TLN_DeleteSequencePack": ([c_void_p], c_bool),
+})
+
+
+class _SequenceDict(Mapping):
+	"""
+	Read-only dictionary of the sequences inside a SequencePack indexed by name. Entries are looked up
+	in the native pack on first access and cached, instead of being harvested when the pack is loaded
+	"""
+	def __init__(self, pack: "SequencePack"):
+		self._pack = pack
+		self._cache = dict()
+
+	def __getitem__(self, name: str) -> "Sequence":
+		sequence = self._cache.get(name)
+		if sequence is None:
+			handle = _tln.TLN_FindSequence(self._pack, _encode_string(name))
+			if handle is None:
+				raise KeyError(name)
+			sequence = Sequence(handle, False)
+			self._cache[name] = sequence
+		return sequence
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield _decode_name(self._pack.get_sequence(index).get_info().name)
+
+	def __len__(self) -> int:
+		return self._pack.count
 
 
 class SequencePack(object):
@@ -1623,14 +1950,12 @@ class SequencePack(object):
 	def __init__(self, handle: c_void_p, owner: bool=True):
 		self._as_parameter_ = handle
 		self.owner = owner
-		self.library = _tln
-		self.count = _tln.TLN_GetSequencePackCount(self)
-		self.sequences = dict()
-		sequence_info = SequenceInfo()
-		for s in range(self.count):
-			sequence = self.get_sequence(s)
-			sequence.get_info(sequence_info)
-			self.sequences[_decode_string(sequence_info.name)] = sequence
+		self._finalizer = _finalize(self, _tln.TLN_DeleteSequencePack, handle) if owner else None
+		self.sequences = _SequenceDict(self)
+
+	@property
+	def count(self) -> int:
+		return _tln.TLN_GetSequencePackCount(self)
 
 	@classmethod
 	def create(cls) -> "SequencePack":
@@ -1639,11 +1964,7 @@ class SequencePack(object):
 
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_CreateSequencePack()
-		if handle is not None:
-			return SequencePack(handle)
-		else:
-			_raise_exception()
+		return SequencePack(_tln.TLN_CreateSequencePack())
 
 	@classmethod
 	def fromfile(cls, filename: str) -> "SequencePack":
@@ -1653,11 +1974,7 @@ class SequencePack(object):
 		:param filename: Name of the SQX file to load
 		:return: instance of the created object
 		"""
-		handle = _tln.TLN_LoadSequencePack(_encode_string(filename))
-		if handle is not None:
-			return SequencePack(handle)
-		else:
-			_raise_exception()
+		return SequencePack(_tln.TLN_LoadSequencePack(_encode_string(filename)))
 
 	def get_sequence(self, index: int) -> Sequence:
 		"""
@@ -1681,7 +1998,7 @@ class SequencePack(object):
 		"""
 		handle = _tln.TLN_FindSequence(self, _encode_string(name))
 		if handle is not None:
-			return Sequence(handle)
+			return Sequence(handle, False)
 		else:
 			_raise_exception()
 
@@ -1691,67 +2008,57 @@ class SequencePack(object):
 
 		:param sequence: Sequence object to add
 		"""
-		sequence_info = SequenceInfo()
-		sequence.get_info(sequence_info)
+		name = _decode_name(sequence.get_info().name)
 		ok = _tln.TLN_AddSequenceToPack(self, sequence)
 		if ok:
-			self.sequences[_decode_string(sequence_info.name)] = sequence
+			self.sequences._cache[name] = sequence
 		_raise_exception(ok)
 
-	def __del__(self):
-		if self.owner:
-			ok = self.library.TLN_DeleteSequencePack(self)
-			_raise_exception(ok)
+	def close(self):
+		"""
+		Deletes the sequence pack right away instead of waiting for garbage collection
+		"""
+		if self._finalizer is not None:
+			self._finalizer()
 
 
 # layer management ------------------------------------------------------------
-_tln.TLN_SetLayer.argtypes = [c_int, c_void_p, c_void_p]
-_tln.TLN_SetLayer.restype = c_bool
-
-_tln.TLN_SetLayerTilemap.argtypes = [c_int, c_void_p]
-_tln.TLN_SetLayerTilemap.restype = c_bool
-_tln.TLN_SetLayerBitmap.argtypes = [c_int, c_void_p]
-_tln.TLN_SetLayerBitmap.restype = c_bool
-_tln.TLN_SetLayerObjects.argtypes = [c_int, c_void_p, c_void_p]
-_tln.TLN_SetLayerObjects.restype = c_bool
-_tln.TLN_SetLayerPalette.argtypes = [c_int, c_void_p]
-_tln.TLN_SetLayerPalette.restype = c_bool
-_tln.TLN_SetLayerPosition.argtypes = [c_int, c_int, c_int]
-_tln.TLN_SetLayerPosition.restype = c_bool
-_tln.TLN_SetLayerScaling.argtypes = [c_int, c_float, c_float]
-_tln.TLN_SetLayerScaling.restype = c_bool
-_tln.TLN_SetLayerTransform.argtypes = [c_int, c_float, c_float, c_float, c_float, c_float]
-_tln.TLN_SetLayerTransform.restype = c_bool
-_tln.TLN_SetLayerPixelMapping.argtypes = [c_int, POINTER(PixelMap)]
-_tln.TLN_SetLayerPixelMapping.restype = c_bool
-_tln.TLN_ResetLayerMode.argtypes = [c_int]
-_tln.TLN_ResetLayerMode.restype = c_bool
-_tln.TLN_SetLayerBlendMode.argtypes = [c_int, c_int, c_ubyte]
-_tln.TLN_SetLayerBlendMode.restype = c_bool
-_tln.TLN_SetLayerColumnOffset.argtypes = [c_int, POINTER(c_int)]
-_tln.TLN_SetLayerColumnOffset.restype = c_bool
-_tln.TLN_SetLayerClip.argtypes = [c_int, c_int, c_int, c_int, c_int]
-_tln.TLN_SetLayerClip.restype = c_bool
-_tln.TLN_DisableLayerClip.argtypes = [c_int]
-_tln.TLN_DisableLayerClip.restype = c_bool
-_tln.TLN_SetLayerMosaic.argtypes = [c_int, c_int, c_int]
-_tln.TLN_SetLayerMosaic.restype = c_bool
-_tln.TLN_DisableLayerMosaic.argtypes = [c_int]
-_tln.TLN_DisableLayerMosaic.restype = c_bool
-_tln.TLN_DisableLayer.argtypes = [c_int]
-_tln.TLN_DisableLayer.restype = c_bool
-_tln.TLN_EnableLayer.argtypes = [c_int]
-_tln.TLN_EnableLayer.restype = c_bool
-_tln.TLN_GetLayerPalette.argtypes = [c_int]
-_tln.TLN_GetLayerPalette.restype = c_void_p
-_tln.TLN_GetLayerTile.argtypes = [c_int, c_int, c_int, POINTER(TileInfo)]
-_tln.TLN_GetLayerTile.restype = c_bool
-_tln.TLN_GetLayerWidth.argtypes = [c_int]
-_tln.TLN_GetLayerWidth.restype = c_int
-_tln.TLN_GetLayerHeight.argtypes = [c_int]
-_tln.TLN_GetLayerHeight.restype = c_int
-_tln.TLN_SetLayerPriority.argtypes = [c_int, c_bool]
-_tln.TLN_SetLayerPriority.restype = c_bool
+_signatures.update({
+	"TLN_SetLayer": ([c_int, c_void_p, c_void_p], c_bool, _check_bool),
+	"TLN_SetLayerTilemap": ([c_int, c_void_p], c_bool, _check_bool),
+	"TLN_SetLayerBitmap": ([c_int, c_void_p], c_bool, _check_bool),
+	"TLN_SetLayerObjects": ([c_int, c_void_p, c_void_p], c_bool, _check_bool),
+	"TLN_SetLayerPalette": ([c_int, c_void_p], c_bool, _check_bool),
+	"TLN_SetLayerPosition": ([c_int, c_int, c_int], c_bool, _check_bool),
+	"TLN_SetLayerScaling": ([c_int, c_float, c_float], c_bool, _check_bool),
+	"TLN_SetLayerTransform": ([c_int, c_float, c_float, c_float, c_float, c_float], c_bool, _check_bool),
+	"TLN_SetLayerPixelMapping": ([c_int, POINTER(PixelMap)], c_bool, _check_bool),
+	"TLN_ResetLayerMode": ([c_int], c_bool, _check_bool),
+	"TLN_SetLayerBlendMode": ([c_int, c_int, c_ubyte], c_bool, _check_bool),
+	"TLN_SetLayerColumnOffset": ([c_int, POINTER(c_int)], c_bool, _check_bool),
+	"TLN_SetLayerClip": ([c_int, c_int, c_int, c_int, c_int], c_bool, _check_bool),
+	"TLN_DisableLayerClip": ([c_int], c_bool, _check_bool),
+	"TLN_SetLayerMosaic": ([c_int, c_int, c_int], c_bool, _check_bool),
+	"TLN_DisableLayerMosaic": ([c_int], c_bool, _check_bool),
+	"TLN_DisableLayer": ([c_int], c_bool, _check_bool),
+	"TLN_EnableLayer": ([c_int], c_bool, _check_bool),
+	"TLN_GetLayerPalette": ([c_int], c_void_p),
+	"TLN_GetLayerTile": ([c_int, c_int, c_int, POINTER(TileInfo)], c_bool, _check_bool),
+	"TLN_GetLayerWidth": ([c_int], c_int),
+	"TLN_GetLayerHeight": ([c_int], c_int),
+	"TLN_SetLayerPriority": ([c_int, c_bool], c_bool, _check_bool),
+})
+
+_TLN_SetLayerPalette = _tln.TLN_SetLayerPalette
+_TLN_SetLayerPosition = _tln.TLN_SetLayerPosition
+_TLN_SetLayerScaling = _tln.TLN_SetLayerScaling
+_TLN_SetLayerTransform = _tln.TLN_SetLayerTransform
+_TLN_SetLayerPixelMapping = _tln.TLN_SetLayerPixelMapping
+_TLN_GetLayerTile = _tln.TLN_GetLayerTile
+_TLN_SetLayerBlendMode = _tln.TLN_SetLayerBlendMode
+_TLN_SetLayerColumnOffset = _tln.TLN_SetLayerColumnOffset
+_TLN_SetLayerClip = _tln.TLN_SetLayerClip
+_TLN_SetLayerMosaic = _tln.TLN_SetLayerMosaic
 
 class Layer(object):
 	"""
@@ -1764,14 +2071,25 @@ class Layer(object):
 	:ivar bitmap: assigned Bitmap object, for bitmap layers
 	:ivar objectlist: assigned ObjectList object, for object list layers
 	"""
+	__slots__ = ('index', '_as_parameter_', 'tilemap', 'bitmap', 'objectlist', '_pixel_map', '_column_offset')
+
 	def __init__(self, index):
 		self.index = index
 		self._as_parameter_ = index
-		self.width = 0
-		self.height = 0
 		self.tilemap = None
 		self.bitmap = None
 		self.objectlist = None
+		self._pixel_map = None
+		self._column_offset = None
+
+	# size is only queried when read, so configuring a layer doesn't pay for it
+	@property
+	def width(self) -> int:
+		return _tln.TLN_GetLayerWidth(self)
+
+	@property
+	def height(self) -> int:
+		return _tln.TLN_GetLayerHeight(self)
 
 	def setup(self, tilemap: Tilemap, tileset: Optional[Tileset]=None):
 		"""
@@ -1780,16 +2098,10 @@ class Layer(object):
 		:param tilemap: Tilemap object with background layout
 		:param tileset: Optional Tileset object. If not set, the Tilemap's own Tileset is selected
 		"""
-		ok = _tln.TLN_SetLayer(self, tileset, tilemap)
-		if ok is True:
-			self.width = _tln.TLN_GetLayerWidth(self)
-			self.height = _tln.TLN_GetLayerHeight(self)
-			self.tilemap = tilemap
-			if tileset is not None:
-				tilemap.set_tileset(tileset)
-			return ok
-		else:
-			_raise_exception()
+		_tln.TLN_SetLayer(self, tileset, tilemap)
+		self.tilemap = tilemap
+		if tileset is not None:
+			tilemap.set_tileset(tileset)
 
 	def set_tilemap(self, tilemap: Tilemap):
 		"""
@@ -1797,16 +2109,10 @@ class Layer(object):
 
 		:param tilemap: Tilemap object with background layout
 		"""
-		ok = _tln.TLN_SetLayerTilemap(self, tilemap)
-		if ok is True:
-			self.width = _tln.TLN_GetLayerWidth(self)
-			self.height = _tln.TLN_GetLayerHeight(self)
-			self.tilemap = tilemap
-			self.bitmap = None
-			self.objectlist = None
-			return ok
-		else:
-			_raise_exception()
+		_tln.TLN_SetLayerTilemap(self, tilemap)
+		self.tilemap = tilemap
+		self.bitmap = None
+		self.objectlist = None
 
 	def set_bitmap(self, bitmap: Bitmap):
 		"""
@@ -1814,16 +2120,10 @@ class Layer(object):
 
 		:param bitmap: Bitmap object with full bitmap background
 		"""
-		ok = _tln.TLN_SetLayerBitmap(self, bitmap)
-		if ok is True:
-			self.width = _tln.TLN_GetLayerWidth(self)
-			self.height = _tln.TLN_GetLayerHeight(self)
-			self.bitmap = bitmap
-			self.tilemap = None
-			self.objectlist = None
-			return ok
-		else:
-			_raise_exception()
+		_tln.TLN_SetLayerBitmap(self, bitmap)
+		self.bitmap = bitmap
+		self.tilemap = None
+		self.objectlist = None
 
 	def set_palette(self, palette: Palette):
 		"""
@@ -1831,8 +2131,7 @@ class Layer(object):
 
 		:param palette: Palette object to assign. By default the Tileset's own palette is used
 		"""
-		ok = _tln.TLN_SetLayerPalette(self, palette)
-		_raise_exception(ok)
+		_TLN_SetLayerPalette(self, palette)
 
 	def set_position(self, x: int, y: int):
 		"""
@@ -1841,8 +2140,7 @@ class Layer(object):
 		:param x: horizontal position
 		:param y: vertical position
 		"""
-		ok = _tln.TLN_SetLayerPosition(self, int(x), int(y))
-		_raise_exception(ok)
+		_TLN_SetLayerPosition(self, int(x), int(y))
 
 	def set_scaling(self, sx: float, sy: float):
 		"""
@@ -1851,8 +2149,7 @@ class Layer(object):
 		:param sx: floating-point value with horizontal scaling factor
 		:param sy: floating-point value with vertical scaling factor
 		"""
-		ok = _tln.TLN_SetLayerScaling(self, sx, sy)
-		_raise_exception(ok)
+		_TLN_SetLayerScaling(self, sx, sy)
 
 	def set_transform(self, angle: float, x: float, y: float, sx: float, sy: float):
 		"""
@@ -1864,24 +2161,42 @@ class Layer(object):
 		:param sx: horizontal scaling factor
 		:param sy: vertical scaling factor
 		"""
-		ok = _tln.TLN_SetLayerTransform(self, angle, x, y, sx, sy)
-		_raise_exception(ok)
+		_TLN_SetLayerTransform(self, angle, x, y, sx, sy)
 
 	def set_pixel_mapping(self, pixel_map: POINTER(PixelMap)):
 		"""
 		Enables pixel mapping displacement table
 
-		:param pixel_map: user-provided list of PixelMap objects of hres*vres size: one item per screen pixel
+		:param pixel_map: user-provided list or ctypes array of PixelMap objects of hres*vres size: one item per screen pixel. \
+			Any object exposing a buffer of packed PixelMap items is used in place without per-item conversion, \
+			like an array.array('h') of interleaved dx, dy values or a numpy array of dtype [('dx', numpy.int16), ('dy', numpy.int16)]. \
+			Buffers of any other item type (int32, float...) raise TypeError
 		"""
-		ok = _tln.TLN_SetLayerPixelMapping(self, pixel_map)
-		_raise_exception(ok)
+		pixel_map = _as_array(PixelMap, pixel_map)
+		_TLN_SetLayerPixelMapping(self, pixel_map)
+		self._pixel_map = pixel_map	# the library keeps using the table, it must stay alive
+
+	def set_pixel_mapping_from_arrays(self, dx, dy):
+		"""
+		Enables pixel mapping displacement table from separate horizontal and vertical sequences. \
+		The table is built in a single contiguous buffer owned by the layer, without creating one PixelMap object per pixel
+
+		:param dx: sequence of integers (list, array.array...) with hres*vres horizontal displacements, one per screen pixel
+		:param dy: sequence of integers with hres*vres vertical displacements, one per screen pixel
+		"""
+		if len(dx) != len(dy):
+			raise ValueError("dx and dy must have the same length")
+		pixel_map = (c_short * (len(dx) * 2))()
+		pixel_map[0::2] = dx
+		pixel_map[1::2] = dy
+		self.set_pixel_mapping((PixelMap * len(dx)).from_buffer(pixel_map))
+		self._pixel_map = pixel_map
 
 	def reset_mode(self):
 		"""
 		Disables all special effects: scaling, affine transform and pixel mapping, and returns to default render mode.
 		"""
-		ok = _tln.TLN_ResetLayerMode(self)
-		_raise_exception(ok)
+		_tln.TLN_ResetLayerMode(self)
 
 	def set_blend_mode(self, mode: int):
 		"""
@@ -1889,17 +2204,19 @@ class Layer(object):
 
 		:param mode: One of the :class:`Blend` defined values
 		"""
-		ok = _tln.TLN_SetLayerBlendMode(self, mode, 0)
-		_raise_exception(ok)
+		_TLN_SetLayerBlendMode(self, mode, 0)
 
 	def set_column_offset(self, offsets: Optional[POINTER(c_int)]=None):
 		"""
 		Enables column offset mode for tiles
 
-		:param offsets: User-provided tuple of integers with offsets, one per column of tiles. Pass None to disable
+		:param offsets: User-provided tuple, list or ctypes array of integers with offsets, one per column of tiles. \
+			Any object exposing a buffer of C ints, like array.array('i') or a numpy int32 array, is used in place, \
+			so it can be updated every frame without any allocation. Pass None to disable
 		"""
-		ok = _tln.TLN_SetLayerColumnOffset(self, offsets)
-		_raise_exception(ok)
+		offsets = _as_array(c_int, offsets)
+		_TLN_SetLayerColumnOffset(self, offsets)
+		self._column_offset = offsets	# the library keeps using the table, it must stay alive
 
 	def set_clip(self, x1: int, y1: int, x2: int, y2: int):
 		"""
@@ -1910,15 +2227,13 @@ class Layer(object):
 		:param x2: right coordinate
 		:param y2: bottom coordinate
 		"""
-		ok = _tln.TLN_SetLayerClip(self, x1, y1, x2, y2)
-		_raise_exception(ok)
+		_TLN_SetLayerClip(self, x1, y1, x2, y2)
 
 	def disable_clip(self):
 		"""
 		Disables clipping rectangle
 		"""
-		ok = _tln.TLN_DisableLayerClip(self)
-		_raise_exception(ok)
+		_tln.TLN_DisableLayerClip(self)
 
 	def set_mosaic(self, pixel_w: int, pixel_h: int):
 		"""
@@ -1927,29 +2242,25 @@ class Layer(object):
 		:param pixel_w: horizontal pixel size
 		:param pixel_h: vertical pixel size
 		"""
-		ok = _tln.TLN_SetLayerMosaic(self, pixel_w, pixel_h)
-		_raise_exception(ok)
+		_TLN_SetLayerMosaic(self, pixel_w, pixel_h)
 
 	def disable_mosaic(self):
 		"""
 		Disables mosaic effect
 		"""
-		ok = _tln.TLN_DisableLayerMosaic(self)
-		_raise_exception(ok)
+		_tln.TLN_DisableLayerMosaic(self)
 
 	def disable(self):
 		"""
 		Disables the layer so it is not drawn
 		"""
-		ok = _tln.TLN_DisableLayer(self)
-		_raise_exception(ok)
+		_tln.TLN_DisableLayer(self)
 		
 	def enable(self):
 		"""
 		Re-enables previously disabled layer
 		"""
-		ok = _tln.TLN_EnableLayer(self)
-		_raise_exception(ok)
+		_tln.TLN_EnableLayer(self)
 		
 	def get_palette(self) -> Palette:
 		"""
@@ -1959,20 +2270,24 @@ class Layer(object):
 		"""
 		handle = _tln.TLN_GetLayerPalette(self)
 		if handle is not None:
-			return Palette(handle)
+			return Palette(handle, False)
 		else:
 			_raise_exception()
 
-	def get_tile(self, x: int, y: int, tile_info: POINTER(TileInfo)):
+	def get_tile(self, x: int, y: int, tile_info: Optional[POINTER(TileInfo)]=None) -> TileInfo:
 		"""
 		Gets detailed info about the tile located in Tilemap space
 
 		:param x: x position inside the Tilemap
 		:param y: y position inside the Tilemap
-		:param tile_info: User-provided TileInfo object where to get the data
+		:param tile_info: optional user-provided TileInfo object where to get the data. If not provided, \
+			an internal TileInfo is reused and returned, that is overwritten by the next call from the same thread
+		:return: the TileInfo with the data
 		"""
-		ok = _tln.TLN_GetLayerTile(self, x, y, tile_info)
-		_raise_exception(ok)
+		if tile_info is None:
+			tile_info = _get_scratch(TileInfo)
+		_TLN_GetLayerTile(self, x, y, tile_info)
+		return tile_info
 
 	def set_priority(self, enable: bool):
 		"""
@@ -1980,8 +2295,7 @@ class Layer(object):
 
 		:param enable: True for enable, False for disable
 		"""
-		ok = _tln.TLN_SetLayerPriority(self, enable)
-		_raise_exception(ok)
+		_tln.TLN_SetLayerPriority(self, enable)
 
 	def set_parallax_factor(self, x: int, y: int):
 		"""
@@ -1990,62 +2304,66 @@ class Layer(object):
 		:param x: Horizontal parallax factor
 		:param y: Vertical parallax factor
 		"""
-		ok = _tln.TLN_SetLayerParallaxFactor(self, x, y)
-		_raise_exception(ok)
+		_tln.TLN_SetLayerParallaxFactor(self, x, y)
 
 
 # sprite management -----------------------------------------------------------
-_tln.TLN_ConfigSprite.argtypes = [c_int, c_void_p, c_ushort]
-_tln.TLN_ConfigSprite.restype = c_bool
-_tln.TLN_SetSpriteSet.argtypes = [c_int, c_void_p]
-_tln.TLN_SetSpriteSet.restype = c_bool
-_tln.TLN_SetSpriteFlags.argtypes = [c_int, c_ushort]
-_tln.TLN_SetSpriteFlags.restype = c_bool
-_tln.TLN_EnableSpriteFlag.argtypes = [c_int, c_uint, c_bool]
-_tln.TLN_EnableSpriteFlag.restype = c_bool
-_tln.TLN_SetSpritePivot.argtypes = [c_int, c_float, c_float]
-_tln.TLN_SetSpritePivot.restype = c_bool
-_tln.TLN_SetSpritePosition.argtypes = [c_int, c_int, c_int]
-_tln.TLN_SetSpritePosition.restype = c_bool
-_tln.TLN_SetSpritePicture.argtypes = [c_int, c_int]
-_tln.TLN_SetSpritePicture.restype = c_bool
-_tln.TLN_SetSpritePalette.argtypes = [c_int, c_void_p]
-_tln.TLN_SetSpritePalette.restype = c_bool
-_tln.TLN_SetSpriteBlendMode.argtypes = [c_int, c_int, c_ubyte]
-_tln.TLN_SetSpriteBlendMode.restype = c_bool
-_tln.TLN_SetSpriteScaling.argtypes = [c_int, c_float, c_float]
-_tln.TLN_SetSpriteScaling.restype = c_bool
-_tln.TLN_ResetSpriteScaling.argtypes = [c_int]
-_tln.TLN_ResetSpriteScaling.restype = c_bool
-_tln.TLN_GetSpritePicture.argtypes = [c_int]
-_tln.TLN_GetSpritePicture.restype = c_int
-_tln.TLN_GetAvailableSprite.restype = c_int
-_tln.TLN_EnableSpriteCollision.argtypes = [c_int, c_bool]
-_tln.TLN_EnableSpriteCollision.restype = c_bool
-_tln.TLN_GetSpriteCollision.argtypes = [c_int]
-_tln.TLN_GetSpriteCollision.restype = c_bool
-_tln.TLN_DisableSprite.argtypes = [c_int]
-_tln.TLN_DisableSprite.restype = c_bool
-_tln.TLN_GetSpritePalette.argtypes = [c_int]
-_tln.TLN_GetSpritePalette.restype = c_void_p
-_tln.TLN_SetSpriteAnimation.argtypes = [c_int, c_void_p, c_int]
-_tln.TLN_SetSpriteAnimation.restype = c_bool
-_tln.TLN_PauseSpriteAnimation.argtypes = [c_int]
-_tln.TLN_PauseSpriteAnimation.restype = c_bool
-_tln.TLN_ResumeSpriteAnimation.argtypes = [c_int]
-_tln.TLN_ResumeSpriteAnimation.restype = c_bool
-_tln.TLN_GetAnimationState.argtypes = [c_int]
-_tln.TLN_GetAnimationState.restype = c_bool
-_tln.TLN_DisableSpriteAnimation.argtypes = [c_int]
-_tln.TLN_DisableSpriteAnimation.restype = c_bool
-_tln.TLN_GetSpriteState.argtypes = [c_int, POINTER(SpriteState)]
-_tln.TLN_GetSpriteState.restype = c_bool
-_tln.TLN_SetFirstSprite.argtypes = [c_int]
-_tln.TLN_SetFirstSprite.restype = c_bool
-_tln.TLN_SetNextSprite.argtypes = [c_int, c_int]
-_tln.TLN_SetNextSprite.restype = c_bool
-_tln.TLN_EnableSpriteMasking.argtypes = [c_int, c_bool]
-_tln.TLN_EnableSpriteMasking.restype = c_bool
+_signatures.update({
+	"TLN_ConfigSprite": ([c_int, c_void_p, c_ushort], c_bool, _check_bool),
+	"TLN_SetSpriteSet": ([c_int, c_void_p], c_bool, _check_bool),
+	"TLN_SetSpriteFlags": ([c_int, c_ushort], c_bool, _check_bool),
+	"TLN_EnableSpriteFlag": ([c_int, c_uint, c_bool], c_bool, _check_bool),
+	"TLN_SetSpritePivot": ([c_int, c_float, c_float], c_bool, _check_bool),
+	"TLN_SetSpritePosition": ([c_int, c_int, c_int], c_bool, _check_bool),
+	"TLN_SetSpritePicture": ([c_int, c_int], c_bool, _check_bool),
+	"TLN_SetSpritePalette": ([c_int, c_void_p], c_bool, _check_bool),
+	"TLN_SetSpriteBlendMode": ([c_int, c_int, c_ubyte], c_bool, _check_bool),
+	"TLN_SetSpriteScaling": ([c_int, c_float, c_float], c_bool, _check_bool),
+	"TLN_ResetSpriteScaling": ([c_int], c_bool, _check_bool),
+	"TLN_GetSpritePicture": ([c_int], c_int),
+	"TLN_GetAvailableSprite": (None, c_int),
+	"TLN_EnableSpriteCollision": ([c_int, c_bool], c_bool, _check_bool),
+	"TLN_GetSpriteCollision": ([c_int], c_bool),
+	"TLN_DisableSprite": ([c_int], c_bool, _check_bool),
+	"TLN_GetSpritePalette": ([c_int], c_void_p),
+	"TLN_SetSpriteAnimation": ([c_int, c_void_p, c_int], c_bool, _check_bool),
+	"TLN_PauseSpriteAnimation": ([c_int], c_bool, _check_bool),
+	"TLN_ResumeSpriteAnimation": ([c_int], c_bool, _check_bool),
+	"TLN_GetAnimationState": ([c_int], c_bool),
+	"TLN_DisableSpriteAnimation": ([c_int], c_bool, _check_bool),
+	"TLN_GetSpriteState": ([c_int, POINTER(SpriteState)], c_bool, _check_bool),
+	"TLN_SetFirstSprite": ([c_int], c_bool, _check_bool),
+	"TLN_SetNextSprite": ([c_int, c_int], c_bool, _check_bool),
+	"TLN_EnableSpriteMasking": ([c_int, c_bool], c_bool, _check_bool),
+})
+
+_TLN_SetSpriteFlags = _tln.TLN_SetSpriteFlags
+_TLN_EnableSpriteFlag = _tln.TLN_EnableSpriteFlag
+_TLN_SetSpritePosition = _tln.TLN_SetSpritePosition
+_TLN_SetSpriteWorldPosition = _tln.TLN_SetSpriteWorldPosition
+_TLN_SetSpritePicture = _tln.TLN_SetSpritePicture
+_TLN_SetSpriteScaling = _tln.TLN_SetSpriteScaling
+_TLN_GetSpriteCollision = _tln.TLN_GetSpriteCollision
+
+# last state set on each sprite index, shared by all the Sprite objects of the same index so calls
+# that change nothing can be skipped. None means unknown, forcing the next call through
+class _SpriteShadow(object):
+	__slots__ = ('flags', 'position', 'blend_mode')
+
+	def __init__(self):
+		self.reset()
+
+	def reset(self):
+		self.flags = None
+		self.position = None
+		self.blend_mode = None
+
+	def update_flag(self, flag, value):
+		if self.flags is not None:
+			self.flags = (self.flags | flag) if value else (self.flags & ~flag)
+
+_sprite_shadows = {}
+
 
 class Sprite(object):
 	"""
@@ -2054,10 +2372,14 @@ class Sprite(object):
 	:ivar index: sprite index, from 0 to num_sprites - 1
 	:ivar spriteset: assigned Spriteset object
 	"""
+	__slots__ = ('index', '_as_parameter_', 'spriteset', '_shadow', '_state')
+
 	def __init__(self, index: int):
 		self.index = index
 		self._as_parameter_ = index
 		self.spriteset = None
+		self._shadow = _sprite_shadows.setdefault(index, _SpriteShadow())
+		self._state = None
 
 	def setup(self, spriteset: Spriteset, flags: int=0):
 		"""
@@ -2066,9 +2388,11 @@ class Sprite(object):
 		:param spriteset: Spriteset object with the graphic data of the sprites
 		:param flags: Optional combination of defined :class:`Flag` values, 0 by default
 		"""
-		ok = _tln.TLN_ConfigSprite(self, spriteset, flags)
+		_tln.TLN_ConfigSprite(self, spriteset, flags)
 		self.spriteset = spriteset
-		_raise_exception(ok)
+		shadow = self._shadow
+		shadow.reset()
+		shadow.flags = flags
 
 	def set_spriteset(self, spriteset: Spriteset):
 		"""
@@ -2076,9 +2400,8 @@ class Sprite(object):
 
 		:param spriteset: Spriteset object with the graphic data of the sprites
 		"""
-		ok = _tln.TLN_SetSpriteSet(self, spriteset)
+		_tln.TLN_SetSpriteSet(self, spriteset)
 		self.spriteset = spriteset
-		_raise_exception(ok)
 
 	def set_flags(self, flags: int=0):
 		"""
@@ -2086,8 +2409,8 @@ class Sprite(object):
 
 		:param flags: Combination of defined :class:`Flag` values
 		"""
-		ok = _tln.TLN_SetSpriteFlags(self, flags)
-		_raise_exception(ok)
+		_TLN_SetSpriteFlags(self, flags)
+		self._shadow.flags = flags
 		
 	def enable_flag(self, flag: int, value: bool=True):
 		"""
@@ -2096,18 +2419,36 @@ class Sprite(object):
 		:param flag: Combination of defined :class:`Flag` values
 		:param value: True to enable (default) or False to disable
 		"""
-		ok = _tln.TLN_EnableSpriteFlag(self, flag, value)
-		_raise_exception(ok)
+		_TLN_EnableSpriteFlag(self, flag, value)
+		self._shadow.update_flag(flag, value)
 
-	def set_pivot(self, u: float, v: float):
+	def set_flag_mask(self, set_mask: int, clear_mask: int=0):
+		"""
+		Enables and disables several flags at once, with a single call
+
+		The current flags are tracked from the calls made through the Sprite objects of this index. When they aren't \
+		known yet, for example on sprites configured natively by :meth:`Engine.load_world`, they're read back once \
+		with :meth:`Sprite.get_state`
+
+		:param set_mask: Combination of defined :class:`Flag` values to enable
+		:param clear_mask: Combination of defined :class:`Flag` values to disable
+		"""
+		shadow = self._shadow
+		if shadow.flags is None:
+			shadow.flags = self.get_state().flags
+		flags = (shadow.flags & ~clear_mask) | set_mask
+		_TLN_SetSpriteFlags(self, flags)
+		shadow.flags = flags
+
+	def set_pivot(self, u: Union[float, c_float], v: Union[float, c_float]):
 		"""
 		Sets sprite pivot point for placement and scaling source. By default is at (0,0) = top left corner. Uses normalized coordinates in [ 0.0 - 1.0] range.
+		Coordinates can also be c_float objects, that are passed without conversion
 
 		:param u: Horizontal position (0.0 = full left, 1.0 = full right)
 		:param v: Vertical position (0.0 = top, 1.0 = bottom)
 		"""
-		ok = _tln.TLN_SetSpritePivot(self, u, v)
-		_raise_exception(ok)
+		_tln.TLN_SetSpritePivot(self, u, v)
 
 	def set_position(self, x: int, y: int):
 		"""
@@ -2116,8 +2457,11 @@ class Sprite(object):
 		:param x: Horizontal position
 		:param y: Vertical position
 		"""
-		ok = _tln.TLN_SetSpritePosition(self, x, y)
-		_raise_exception(ok)
+		position = (x, y)
+		shadow = self._shadow
+		if position != shadow.position:
+			_TLN_SetSpritePosition(self, x, y)
+			shadow.position = position
 
 	def set_world_position(self, x: int, y: int):
 		"""
@@ -2126,28 +2470,45 @@ class Sprite(object):
 		:param x: Horizontal world position of pivot (0 = left margin)
 		:param y: Vertical world position of pivot (0 = top margin)
 		"""
-		ok = _tln.TLN_SetSpriteWorldPosition(self, x, y)
-		_raise_exception(ok)		
+		_TLN_SetSpriteWorldPosition(self, x, y)
+		self._shadow.position = None
 
 	def set_picture(self, picture: Union[int,str]):
 		"""
 		Sets the actual graphic contained in the Spriteset to the sprite
 
-		:param picture: can be an integer with the index inside the Spriteset, or a string with its name
+		:param picture: can be an integer with the index inside the Spriteset, or a string with its name. \
+			Names need a Spriteset assigned to the sprite, otherwise ValueError is raised
 		"""
-		ok = False
-		param_type = type(picture)
-		if param_type is int:
-			ok = _tln.TLN_SetSpritePicture(self, picture)
-		elif param_type is str:
-			entry = _tln.TLN_FindSpritesetSprite(self.spriteset, picture)
-			if entry != -1:
-				ok = _tln.TLN_SetSpritePicture(self, entry)
-			else:
-				return
+		picture_type = picture.__class__
+		if picture_type is int:
+			_TLN_SetSpritePicture(self, picture)
+		elif picture_type is str:
+			self.set_picture_name(picture)
 		else:
-			return
-		_raise_exception(ok)
+			raise TypeError(f"picture must be int or str, not {picture_type.__name__}")
+
+	def set_picture_index(self, index: int):
+		"""
+		Sets the actual graphic contained in the Spriteset by its index, without the type check of :meth:`Sprite.set_picture`
+
+		:param index: index of the graphic inside the Spriteset
+		"""
+		_TLN_SetSpritePicture(self, index)
+
+	def set_picture_name(self, name: str):
+		"""
+		Sets the actual graphic contained in the Spriteset by its name, without the type check of :meth:`Sprite.set_picture`
+
+		:param name: name of the graphic inside the Spriteset. Unknown names are ignored. Raises ValueError if the \
+			sprite has no Spriteset assigned with :meth:`Sprite.setup` or :meth:`Sprite.set_spriteset`
+		"""
+		spriteset = self.spriteset
+		if spriteset is None:
+			raise ValueError(f"sprite {self.index} has no spriteset to look up '{name}'")
+		entry = spriteset.find_sprite(name)
+		if entry != -1:
+			_TLN_SetSpritePicture(self, entry)
 
 	def set_palette(self, palette: Palette):
 		"""
@@ -2155,8 +2516,7 @@ class Sprite(object):
 
 		:param palette: Palette object to set
 		"""
-		ok = _tln.TLN_SetSpritePalette(self, palette)
-		_raise_exception(ok)
+		_tln.TLN_SetSpritePalette(self, palette)
 
 	def set_blend_mode(self, mode: int):
 		"""
@@ -2164,25 +2524,26 @@ class Sprite(object):
 
 		:param mode: One of the :class:`Blend` defined values
 		"""
-		ok = _tln.TLN_SetSpriteBlendMode(self, mode, 0)
-		_raise_exception(ok)
+		shadow = self._shadow
+		if mode != shadow.blend_mode:
+			_tln.TLN_SetSpriteBlendMode(self, mode, 0)
+			shadow.blend_mode = mode
 
-	def set_scaling(self, sx: float, sy: float):
+	def set_scaling(self, sx: Union[float, c_float], sy: Union[float, c_float]):
 		"""
-		Enables sprite scaling
+		Enables sprite scaling. Factors can also be c_float objects, that are passed without conversion: \
+		animated scaling can keep two of them and update their value each frame
 
 		:param sx: floating-point value with horizontal scaling factor
 		:param sy: floating-point value with vertical scaling factor
 		"""
-		ok = _tln.TLN_SetSpriteScaling(self, sx, sy)
-		_raise_exception(ok)
+		_TLN_SetSpriteScaling(self, sx, sy)
 
 	def reset_mode(self):
 		"""
 		Disables scaling and returns to default render mode.
 		"""
-		ok = _tln.TLN_ResetSpriteScaling(self)
-		_raise_exception(ok)
+		_tln.TLN_ResetSpriteScaling(self)
 
 	def get_picture(self) -> int:
 		"""
@@ -2198,8 +2559,7 @@ class Sprite(object):
 
 		:param mode: True for enabling or False for disabling
 		"""
-		ok = _tln.TLN_EnableSpriteCollision(self, mode)
-		_raise_exception(ok)
+		_tln.TLN_EnableSpriteCollision(self, mode)
 
 	def check_collision(self) -> bool:
 		"""
@@ -2207,14 +2567,16 @@ class Sprite(object):
 
 		:return: True if collision with another sprite detected, or False if not
 		"""
-		return _tln.TLN_GetSpriteCollision(self)
+		return _TLN_GetSpriteCollision(self)
 
 	def disable(self):
 		"""
 		Disables the sprite so it is not drawn
 		"""
-		ok = _tln.TLN_DisableSprite(self)
-		_raise_exception(ok)
+		_tln.TLN_DisableSprite(self)
+		shadow = self._shadow
+		shadow.position = None
+		shadow.blend_mode = None
 
 	def get_palette(self) -> Palette:
 		"""
@@ -2224,7 +2586,7 @@ class Sprite(object):
 		"""
 		handle = _tln.TLN_GetSpritePalette(self)
 		if handle is not None:
-			return Palette(handle)
+			return Palette(handle, False)
 		else:
 			_raise_exception()
 
@@ -2235,8 +2597,7 @@ class Sprite(object):
 		:param sequence: Sequence object to play on the sprite
 		:param loop: number of times to repeat, 0=infinite
 		"""
-		ok = _tln.TLN_SetSpriteAnimation(self, sequence, loop)
-		_raise_exception(ok)
+		_tln.TLN_SetSpriteAnimation(self, sequence, loop)
 
 	def get_animation_state(self) -> bool:
 		"""
@@ -2250,38 +2611,40 @@ class Sprite(object):
 		"""
 		Paused sprite animation
 		"""
-		ok = _tln.TLN_PauseSpriteAnimation(self)
-		_raise_exception(ok)
+		_tln.TLN_PauseSpriteAnimation(self)
 	
 	def resume_animation(self):
 		"""
 		Resumes paused animation
 		"""
-		ok = _tln.TLN_ResumeSpriteAnimation(self)
-		_raise_exception(ok)
+		_tln.TLN_ResumeSpriteAnimation(self)
 
 	def disable_animation(self):
 		"""
 		Disables the animation so it doesn't run
 		"""
-		ok = _tln.TLN_DisableSpriteAnimation(self)
-		_raise_exception(ok)
+		_tln.TLN_DisableSpriteAnimation(self)
 
-	def get_state(self, state: POINTER(SpriteState)):
+	def get_state(self, state: Optional[POINTER(SpriteState)]=None) -> SpriteState:
 		"""
 		Returns runtime info about the sprite
 
-		:param state: user-allocated SpriteState structure
+		:param state: optional user-allocated SpriteState structure. If not provided, a SpriteState owned by \
+			the sprite is reused and returned, that is overwritten by the next call for the same sprite
+		:return: the SpriteState with the data
 		"""
-		ok = _tln.TLN_GetSpriteState(self, state)
-		_raise_exception(ok)
+		if state is None:
+			state = self._state
+			if state is None:
+				state = self._state = SpriteState()
+		_tln.TLN_GetSpriteState(self, state)
+		return state
 
 	def set_first(self):
 		"""
 		Sets this to be the first sprite drawn (beginning of list)
 		"""
-		ok = _tln.TLN_SetFirstSprite(self)
-		_raise_exception(ok)
+		_tln.TLN_SetFirstSprite(self)
 
 	def set_next(self, next: int):
 		"""
@@ -2289,25 +2652,23 @@ class Sprite(object):
 
 		:param next: sprite to draw after this one
 		"""
-		ok = _tln.TLN_SetNextSprite(self, next)
-		_raise_exception(ok)
+		_tln.TLN_SetNextSprite(self, next)
 	
 	def enable_masking(self, enable: bool=True):
 		"""
 		Enables or disables masking for this sprite, if enabled it won't be drawn inside the region set up with Engine.set_sprite_mask_region()
 		"""
-		ok = _tln.TLN_EnableSpriteMasking(self, enable)
-		_raise_exception(ok)
+		_tln.TLN_EnableSpriteMasking(self, enable)
+		self._shadow.update_flag(Flags.MASKED, enable)
 
 
 # color cycle animation engine ------------------------------------------------------------
-_tln.TLN_SetPaletteAnimation.argtypes = [c_int, c_void_p, c_void_p, c_bool]
-_tln.TLN_SetPaletteAnimation.restype = c_bool
-_tln.TLN_SetPaletteAnimationSource.argtypes = [c_int, c_void_p]
-_tln.TLN_SetPaletteAnimationSource = c_bool
-_tln.TLN_GetAvailableAnimation.restype = c_int
-_tln.TLN_DisablePaletteAnimation.argtypes = [c_int]
-_tln.TLN_DisablePaletteAnimation.restype = c_bool
+_signatures.update({
+	"TLN_SetPaletteAnimation": ([c_int, c_void_p, c_void_p, c_bool], c_bool, _check_bool),
+	"TLN_SetPaletteAnimationSource": ([c_int, c_void_p], c_bool, _check_bool),
+	"TLN_GetAvailableAnimation": (None, c_int),
+	"TLN_DisablePaletteAnimation": ([c_int], c_bool, _check_bool),
+})
 
 
 class Animation(object):
@@ -2316,6 +2677,8 @@ class Animation(object):
 
 	:ivar index: animation index, from 0 to num_animations - 1
 	"""
+	__slots__ = ('index', '_as_parameter_')
+
 	def __init__(self, index: int):
 		self.index = index
 		self._as_parameter_ = index
@@ -2328,8 +2691,7 @@ class Animation(object):
 		:param sequence: Sequence object to play on the palette
 		:param blend: True for smooth frame interpolation, False for classic coarse mode
 		"""
-		ok = _tln.TLN_SetPaletteAnimation(self, palette, sequence, blend)
-		_raise_exception(ok)
+		_tln.TLN_SetPaletteAnimation(self, palette, sequence, blend)
 
 	def set_palette_animation_source(self, palette: Palette):
 		"""
@@ -2338,12 +2700,10 @@ class Animation(object):
 
 		:param palette: Palette object to assign
 		"""
-		ok = _tln.TLN_SetPaletteAnimationSource(self, palette)
-		_raise_exception(ok)
+		_tln.TLN_SetPaletteAnimationSource(self, palette)
 
 	def disable(self):
 		"""
 		Disables the animation so it doesn't run
 		"""
-		ok = _tln.TLN_DisablePaletteAnimation(self)
-		_raise_exception(ok)
+		_tln.TLN_DisablePaletteAnimation(self)
@@ -0,0 +1,150 @@
+"""
+Regression tests for the Python side of the binding. They need the native library to import the module,
+and are skipped when it can't be loaded
+"""
+
+import sys
+import unittest
+from array import array
+from unittest import mock
+from os import path
+
+sys.path.insert(0, path.join(path.dirname(__file__), "..", "src"))
+try:
+	import tilengine
+except OSError as error:
+	raise unittest.SkipTest(f"native library not available: {error}")
+
+
+class AsArrayTest(unittest.TestCase):
+	def test_matching_buffers_are_mapped(self):
+		self.assertEqual(len(tilengine._as_array(tilengine.PixelMap, array("h", [1, 2, 3, 4]))), 2)
+		self.assertEqual(len(tilengine._as_array(tilengine.Tile, array("H", [1, 2]))), 1)
+		self.assertEqual(len(tilengine._as_array(tilengine.Tile, array("I", [1, 2]))), 2)
+		self.assertEqual(len(tilengine._as_array(tilengine.Tile, bytearray(8))), 2)
+
+	def test_mismatched_structure_buffers_are_rejected(self):
+		with self.assertRaises(TypeError):
+			tilengine._as_array(tilengine.PixelMap, array("i", [1, 2, 3, 4]))
+		with self.assertRaises(TypeError):
+			tilengine._as_array(tilengine.Tile, array("f", [1.0]))
+
+	def test_mismatched_simple_buffers_are_rejected(self):
+		with self.assertRaises(TypeError):
+			tilengine._as_array(tilengine.c_int, array("h", [1, 2]))
+		with self.assertRaises(ValueError):
+			tilengine._as_array(tilengine.Tile, bytearray(6))
+
+
+class PixelMappingTest(unittest.TestCase):
+	def test_wrong_dtype_buffer_is_rejected(self):
+		layer = tilengine.Layer(0)
+		with self.assertRaises(TypeError):
+			layer.set_pixel_mapping(array("i", [1, 2, 3, 4]))
+		with self.assertRaises(TypeError):
+			layer.set_pixel_mapping(array("f", [1.0, 2.0]))
+
+	def test_interleaved_shorts_are_accepted(self):
+		layer = tilengine.Layer(0)
+		layer.set_pixel_mapping(array("h", [1, 2, 3, 4]))
+		self.assertEqual((layer._pixel_map[1].dx, layer._pixel_map[1].dy), (3, 4))
+
+	def test_structured_records_are_checked(self):
+		layer = tilengine.Layer(0)
+		layer.set_pixel_mapping(memoryview((tilengine.PixelMap * 2)()))
+		with self.assertRaises(TypeError):
+			layer.set_pixel_mapping(memoryview((tilengine.Tile * 2)()))
+
+
+class CallbackTest(unittest.TestCase):
+	class Device:
+		def on_frame(self, frame):
+			pass
+
+	def test_method_with_address_attribute_is_wrapped(self):
+		self.Device.on_frame.address = 1
+		try:
+			callback = tilengine._make_callback(tilengine._video_callback_function, self.Device().on_frame)
+		finally:
+			del self.Device.on_frame.address
+		self.assertFalse(hasattr(callback, "source"))
+
+	def test_native_address_is_bound(self):
+		native = tilengine._video_callback_function(lambda frame: None)
+
+		class Compiled:
+			address = tilengine.cast(native, tilengine.c_void_p).value
+
+			def __call__(self, frame):
+				pass
+
+		compiled = Compiled()
+		callback = tilengine._make_callback(tilengine._video_callback_function, compiled)
+		self.assertIs(callback.source, compiled)
+
+
+class SetTilesTest(unittest.TestCase):
+	def setUp(self):
+		self.tilemap = tilengine.Tilemap.create(4, 4, None)
+
+	def test_tile_count_must_match_block(self):
+		with self.assertRaises(ValueError):
+			self.tilemap.set_tiles(0, 0, 2, 2, [tilengine.Tile()] * 3)
+
+	def test_pointers_are_rejected(self):
+		tiles = (tilengine.Tile * 4)()
+		with self.assertRaises(TypeError):
+			self.tilemap.set_tiles(0, 0, 2, 2, tilengine.pointer(tiles[0]))
+		with self.assertRaises(TypeError):
+			self.tilemap.set_tiles(0, 0, 2, 2, tilengine.byref(tiles))
+
+	def test_block_is_released_when_copy_fails(self):
+		error = tilengine.TilengineException("out of range")
+		with mock.patch.object(tilengine.Tilemap, "copy_tiles", side_effect=error), \
+			mock.patch.object(tilengine.Tilemap, "close") as close:
+			with self.assertRaises(tilengine.TilengineException):
+				self.tilemap.set_tiles(3, 3, 2, 2, [tilengine.Tile()] * 4)
+		close.assert_called_once_with()
+
+	def test_clear_region_at_map_edge(self):
+		with mock.patch.object(tilengine.Tilemap, "copy_tiles") as copy_tiles:
+			self.tilemap.clear_region(2, 2, 2, 2)
+		copy_tiles.assert_called_once_with(0, 0, 2, 2, self.tilemap, 2, 2)
+
+	def test_clear_region_out_of_range_raises_and_releases_block(self):
+		error = tilengine.TilengineException("out of range")
+		with mock.patch.object(tilengine.Tilemap, "copy_tiles", side_effect=error), \
+			mock.patch.object(tilengine.Tilemap, "close") as close:
+			with self.assertRaises(tilengine.TilengineException):
+				self.tilemap.clear_region(3, 3, 2, 2)
+		close.assert_called_once_with()
+
+
+class SpritePictureTest(unittest.TestCase):
+	def test_name_without_spriteset_raises(self):
+		sprite = tilengine.Sprite(0)
+		with self.assertRaises(ValueError):
+			sprite.set_picture("walk1")
+		with self.assertRaises(ValueError):
+			sprite.set_picture_name("walk1")
+
+
+class SpriteShadowTest(unittest.TestCase):
+	def test_wrappers_of_same_index_share_state(self):
+		first, second = tilengine.Sprite(5), tilengine.Sprite(5)
+		with mock.patch.object(tilengine, "_TLN_SetSpritePosition") as set_position:
+			first.set_position(1, 1)
+			second.set_position(2, 2)
+			first.set_position(1, 1)
+		self.assertEqual(set_position.call_count, 3)
+
+	def test_unchanged_position_is_skipped(self):
+		sprite = tilengine.Sprite(6)
+		with mock.patch.object(tilengine, "_TLN_SetSpritePosition") as set_position:
+			sprite.set_position(1, 1)
+			tilengine.Sprite(6).set_position(1, 1)
+		self.assertEqual(set_position.call_count, 1)
+
+
+if __name__ == "__main__":
+	unittest.main()